@@ -4,7 +4,7 @@
 This example demonstrates:
 - on_event() with exact and wildcard patterns
 - set_lifecycle_callback() for command lifecycle
-- Both sync and async callbacks
+- Plain sync callbacks (use async def only when a callback needs to await)
 - Exception handling in callbacks
 
 Try it:
@@ -16,60 +16,72 @@ import asyncio
 
 from cmdorc import CommandConfig, CommandOrchestrator, RunnerConfig
 
+# Commands are invariant, so they are built (and validated) once at import time
+COMMANDS = (
+    CommandConfig(
+        name="Build",
+        command="echo '🔨 Building...'; sleep 0.3; echo '✓ Built'",
+        triggers=["build"],
+    ),
+    CommandConfig(
+        name="Test",
+        command="echo '🧪 Testing...'; sleep 0.3; echo '✓ Passed'",
+        triggers=["test"],
+    ),
+)
+
 
 async def main():
     """Demonstrate callback patterns."""
 
-    # Commands
-    commands = [
-        CommandConfig(
-            name="Build",
-            command="echo '🔨 Building...'; sleep 0.3; echo '✓ Built'",
-            triggers=["build"],
-        ),
-        CommandConfig(
-            name="Test",
-            command="echo '🧪 Testing...'; sleep 0.3; echo '✓ Passed'",
-            triggers=["test"],
-        ),
-    ]
-
-    config = RunnerConfig(commands=commands, vars={})
+    config = RunnerConfig(commands=list(COMMANDS), vars={})
     orchestrator = CommandOrchestrator(config)
 
+    # Exact event names are a dict lookup at dispatch time; wildcard patterns are
+    # checked one by one against every event. Register exact names when the set
+    # of events is known, and keep wildcards for genuinely open-ended suffixes.
+    lifecycle_events = ("command_started", "command_success", "command_failed", "command_cancelled")
+
+    # Set once a run's completion callbacks have fired, so each step continues
+    # as soon as callbacks have actually run instead of sleeping a fixed amount
+    settled = asyncio.Event()
+
     # Step 1: Exact event callback
-    async def on_build_event(handle, context):
+    def on_build_event(handle, context):
         """Called for 'build_complete' event."""
         print("→ Build complete event fired")
 
     orchestrator.on_event("build_complete", on_build_event)
 
-    # Step 2: Wildcard event callback (matches command_*:Test)
-    async def on_test_lifecycle(handle, context):
+    # Step 2: One callback for every Test lifecycle event (exact names, not command_*:Test)
+    def on_test_lifecycle(handle, context):
         """Called on any Test lifecycle event."""
         event_type = "unknown"
         if handle and hasattr(handle, "state"):
             event_type = str(handle.state).lower()
         print(f"→ Test lifecycle event: {event_type}")
 
-    orchestrator.on_event("command_*:Test", on_test_lifecycle)
+    for event in lifecycle_events:
+        orchestrator.on_event(f"{event}:Test", on_test_lifecycle)
 
-    # Step 3: Wildcard for all command events
+    # Step 3: Sync callback for every Build lifecycle event
     def sync_callback(handle, context):
         """Synchronous callback (not async)."""
         if handle:
             print(f"  [Sync] {handle.command_name} event")
 
-    orchestrator.on_event("command_*:Build", sync_callback)
+    for event in lifecycle_events:
+        orchestrator.on_event(f"{event}:Build", sync_callback)
 
     # Step 4: Lifecycle callbacks per command
-    async def on_build_success(handle, context):
+    def on_build_success(handle, context):
         """Called when Build succeeds."""
         print("  ✅ Build succeeded - can now test")
 
-    async def on_build_failure(handle, context):
+    def on_build_failure(handle, context):
         """Called when Build fails."""
         print("  ❌ Build failed - fix errors")
+        settled.set()
 
     orchestrator.set_lifecycle_callback(
         "Build",
@@ -78,30 +90,33 @@ async def main():
     )
 
     # Step 5: Callback that handles exceptions gracefully
-    async def risky_callback(handle, context):
+    def risky_callback(handle, context):
         """Callback that might fail."""
         if handle and handle.command_name == "Test":
-            # Simulate work that might fail
-            await asyncio.sleep(0.1)
             print("  ℹ️  Test callback executed")
+        settled.set()
 
+    # Wildcard: fires for every command_success, whatever the command name
     orchestrator.on_event("command_success:*", risky_callback)
 
     # Step 6: Run commands and observe callbacks
     print("Running Build command...")
     handle1 = await orchestrator.run_command("Build")
     await handle1.wait(timeout=5.0)
-    await asyncio.sleep(0.2)
+    await asyncio.wait_for(settled.wait(), timeout=1.0)
+    settled.clear()
 
     print("\nRunning Test command...")
     handle2 = await orchestrator.run_command("Test")
     await handle2.wait(timeout=5.0)
-    await asyncio.sleep(0.2)
+    await asyncio.wait_for(settled.wait(), timeout=1.0)
+    settled.clear()
 
     # Step 7: Trigger event manually
+    # trigger() awaits matching callbacks before returning, so no wait is needed
     print("\nTriggering manual event...")
     await orchestrator.trigger("build_complete")
-    await asyncio.sleep(0.2)
+
     # Step Clean up
     await orchestrator.shutdown()
     print("\n✅ Callbacks demonstration complete")
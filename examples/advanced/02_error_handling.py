@@ -21,35 +21,44 @@ from cmdorc import (
     ConcurrencyLimitError,
     DebounceError,
     RunnerConfig,
+    RunState,
+)
+
+# Commands for the error scenarios, built (and validated) once at import time
+COMMANDS = (
+    CommandConfig(
+        name="FastTask",
+        command="echo 'Done'; exit 0",
+        triggers=["fast"],
+        max_concurrent=1,
+    ),
+    CommandConfig(
+        name="SlowTask",
+        command="echo 'Running...'; sleep 2; echo 'Done'",
+        triggers=["slow"],
+        max_concurrent=1,
+    ),
+    CommandConfig(
+        name="DebounceTask",
+        command="echo 'Task'",
+        triggers=["debounce"],
+        debounce_in_ms=1000,
+    ),
+)
+
+TIMED_OUT_COMMAND = CommandConfig(
+    name="TimedOut",
+    command="sleep 10",  # Will timeout
+    triggers=["timed_out"],
+    timeout_secs=1,
 )
 
 
 async def main():
     """Demonstrate error handling patterns."""
 
-    # Step 1: Create commands for error scenarios
-    commands = [
-        CommandConfig(
-            name="FastTask",
-            command="echo 'Done'; exit 0",
-            triggers=["fast"],
-            max_concurrent=1,
-        ),
-        CommandConfig(
-            name="SlowTask",
-            command="echo 'Running...'; sleep 2; echo 'Done'",
-            triggers=["slow"],
-            max_concurrent=1,
-        ),
-        CommandConfig(
-            name="DebounceTask",
-            command="echo 'Task'",
-            triggers=["debounce"],
-            debounce_in_ms=1000,
-        ),
-    ]
-
-    config = RunnerConfig(commands=commands, vars={})
+    # Step 1: Create orchestrator
+    config = RunnerConfig(commands=list(COMMANDS), vars={})
     orchestrator = CommandOrchestrator(config)
 
     # Step 2: Handle CommandNotFoundError
@@ -85,19 +94,13 @@ async def main():
 
     # Step 5: Handle execution timeouts gracefully
     print("\n4. Timeout Handling:")
-    config_with_timeout = CommandConfig(
-        name="TimedOut",
-        command="sleep 10",  # Will timeout
-        triggers=["timed_out"],
-        timeout_secs=1,
-    )
-    orchestrator.add_command(config_with_timeout)
+    orchestrator.add_command(TIMED_OUT_COMMAND)
 
     try:
         handle = await orchestrator.run_command("TimedOut")
         await handle.wait(timeout=2.0)
-        print(f"   State: {handle.state}")
-        if handle.state == "failed":
+        print(f"   State: {handle.state.value}")
+        if handle.state == RunState.FAILED:
             print("   ✓ Command timed out as expected")
     except asyncio.TimeoutError:
         print("   ✓ Wait timeout (command timed out)")
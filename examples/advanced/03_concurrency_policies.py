@@ -16,6 +16,37 @@ import asyncio
 
 from cmdorc import CommandConfig, CommandOrchestrator, ConcurrencyLimitError, RunnerConfig
 
+# Command configs are invariant, so they are built (and validated) once at import time
+UNLIMITED_COMMAND = CommandConfig(
+    name="Unlimited",
+    command="echo 'Running'; sleep 0.3; echo 'Done'",
+    triggers=["unlimited"],
+    max_concurrent=0,  # Unlimited
+)
+
+SINGLE_COMMAND = CommandConfig(
+    name="Single",
+    command="echo 'Task'; sleep 0.5; echo 'Done'",
+    triggers=["single"],
+    max_concurrent=1,
+    on_retrigger="ignore",
+)
+
+RESTART_COMMAND = CommandConfig(
+    name="RestartTask",
+    command="echo 'Starting'; sleep 2; echo 'Done'",
+    triggers=["restart"],
+    max_concurrent=1,
+    on_retrigger="cancel_and_restart",
+)
+
+DEBOUNCE_COMMAND = CommandConfig(
+    name="Debounced",
+    command="echo 'Run'",
+    triggers=["debounced"],
+    debounce_in_ms=1000,
+)
+
 
 async def main():
     """Demonstrate concurrency policies."""
@@ -24,21 +55,13 @@ async def main():
     print("1. Unlimited Concurrency (max_concurrent=0)")
     print("   Running 5 instances in parallel...")
 
-    unlimited_config = CommandConfig(
-        name="Unlimited",
-        command="echo 'Running'; sleep 0.3; echo 'Done'",
-        triggers=["unlimited"],
-        max_concurrent=0,  # Unlimited
-    )
-
-    config = RunnerConfig(commands=[unlimited_config], vars={})
+    config = RunnerConfig(commands=[UNLIMITED_COMMAND], vars={})
     orchestrator = CommandOrchestrator(config)
 
-    handles = []
-    for i in range(5):
-        h = await orchestrator.run_command("Unlimited")
-        handles.append(h)
-        print(f"   Started run {i + 1}")
+    # Submit all runs at once so their subprocess spawns overlap
+    handles = await asyncio.gather(*(orchestrator.run_command("Unlimited") for _ in range(5)))
+    for i, h in enumerate(handles, start=1):
+        print(f"   Started run {i}: {h.run_id[:8]}")
 
     await asyncio.gather(*[h.wait(timeout=5.0) for h in handles])
     print("   ✓ All 5 runs completed\n")
@@ -47,15 +70,7 @@ async def main():
     print("2. Single Concurrency (max_concurrent=1)")
     print("   Attempting 2 concurrent runs...")
 
-    single_config = CommandConfig(
-        name="Single",
-        command="echo 'Task'; sleep 0.5; echo 'Done'",
-        triggers=["single"],
-        max_concurrent=1,
-        on_retrigger="ignore",
-    )
-
-    config = RunnerConfig(commands=[single_config], vars={})
+    config = RunnerConfig(commands=[SINGLE_COMMAND], vars={})
     orchestrator = CommandOrchestrator(config)
 
     try:
@@ -75,15 +90,7 @@ async def main():
     print("3. cancel_and_restart Policy")
     print("   Restarting command when retriggered...")
 
-    restart_config = CommandConfig(
-        name="RestartTask",
-        command="echo 'Starting'; sleep 2; echo 'Done'",
-        triggers=["restart"],
-        max_concurrent=1,
-        on_retrigger="cancel_and_restart",
-    )
-
-    config = RunnerConfig(commands=[restart_config], vars={})
+    config = RunnerConfig(commands=[RESTART_COMMAND], vars={})
     orchestrator = CommandOrchestrator(config)
 
     h1 = await orchestrator.run_command("RestartTask")
@@ -95,7 +102,7 @@ async def main():
     print(f"   Restarted: {h2.run_id[:8]}...")
 
     await h2.wait(timeout=5.0)
-    await asyncio.sleep(0.1)
+    await orchestrator.wait_until_idle(timeout=5.0)  # Cancelled first run fully settled
 
     print(f"   First run state: {h1.state}")
     print(f"   Second run state: {h2.state}")
@@ -105,14 +112,7 @@ async def main():
     print("4. Debounce (debounce_in_ms=1000)")
     print("   Preventing rapid re-runs...")
 
-    debounce_config = CommandConfig(
-        name="Debounced",
-        command="echo 'Run'",
-        triggers=["debounced"],
-        debounce_in_ms=1000,
-    )
-
-    config = RunnerConfig(commands=[debounce_config], vars={})
+    config = RunnerConfig(commands=[DEBOUNCE_COMMAND], vars={})
     orchestrator = CommandOrchestrator(config)
 
     h1 = await orchestrator.run_command("Debounced")
@@ -13,6 +13,8 @@ Try it:
 # ruff: noqa: T201
 
 import asyncio
+import time
+from collections import deque
 
 from cmdorc import (
     CommandConfig,
@@ -28,11 +30,11 @@ from cmdorc import (
 class LoggingExecutor(CommandExecutor):
     """Custom executor that logs all operations."""
 
-    def __init__(self, base_executor: CommandExecutor | None = None):
-        """Initialize with optional base executor."""
+    def __init__(self, base_executor: CommandExecutor | None = None, max_log_entries: int = 10_000):
+        """Initialize with optional base executor and a bounded log."""
         self.base_executor = base_executor or LocalSubprocessExecutor()
         self.run_count = 0
-        self.log = []
+        self.log: deque[str] = deque(maxlen=max_log_entries)
 
     async def start_run(self, result: RunResult, resolved: ResolvedCommand) -> None:
         """Start a run with logging."""
@@ -60,7 +62,7 @@ class LoggingExecutor(CommandExecutor):
 
     def get_log(self) -> list[str]:
         """Get execution log."""
-        return self.log.copy()
+        return list(self.log)
 
 
 class CountingExecutor(CommandExecutor):
@@ -74,9 +76,7 @@ class CountingExecutor(CommandExecutor):
 
     async def start_run(self, result: RunResult, resolved: ResolvedCommand) -> None:
         """Start and measure execution."""
-        import time
-
-        result._custom_start = time.time()
+        result._custom_start = time.monotonic()
         await self.base_executor.start_run(result, resolved)
 
     async def cancel_run(self, result: RunResult, comment: str) -> None:
@@ -48,6 +48,16 @@ async def main():
 
     orchestrator.on_event("command_started:*", on_start)
 
+    # Deploy ends the chain; its success tells us the file_saved workflow is done.
+    # (The manual Lint run below also chains into Deploy, so check the trigger chain.)
+    chain_done = asyncio.Event()
+
+    def on_deploy_success(handle, context):
+        if "file_saved" in handle.trigger_chain:
+            chain_done.set()
+
+    orchestrator.set_lifecycle_callback("Deploy", on_success=on_deploy_success)
+
     print("=== Manual Run (No Chain) ===")
     handle = await orchestrator.run_command("Lint")
     await handle.wait()
@@ -55,7 +65,7 @@ async def main():
 
     print("=== Triggered Workflow ===")
     await orchestrator.trigger("file_saved")
-    await asyncio.sleep(0.5)  # Let chain complete
+    await asyncio.wait_for(chain_done.wait(), timeout=5.0)
 
     print("\n=== History Inspection ===")
     for cmd_name in ["Lint", "Test", "Deploy"]:
@@ -16,6 +16,83 @@ import asyncio
 
 from cmdorc import CommandConfig, CommandOrchestrator, RunnerConfig
 
+# Each section's commands are invariant, so they are built (and validated) once at import time
+CYCLE_COMMANDS = (
+    CommandConfig(
+        name="A",
+        command="echo 'A executed'",
+        triggers=["start", "command_success:B"],
+        loop_detection=True,  # Prevent cycles
+    ),
+    CommandConfig(
+        name="B",
+        command="echo 'B executed'",
+        triggers=["command_success:A"],
+        loop_detection=True,  # Prevent cycles
+    ),
+)
+
+INDEPENDENT_COMMANDS = (
+    CommandConfig(
+        name="TaskX",
+        command="echo 'X'; sleep 0.1",
+        triggers=["task_x"],
+    ),
+    CommandConfig(
+        name="TaskY",
+        command="echo 'Y'; sleep 0.1",
+        triggers=["task_y"],
+    ),
+)
+
+CHAIN_COMMANDS = (
+    CommandConfig(
+        name="Lint",
+        command="echo '🔍 Linting...'; sleep 0.1",
+        triggers=["start"],
+        loop_detection=True,
+    ),
+    CommandConfig(
+        name="Test",
+        command="echo '🧪 Testing...'; sleep 0.1",
+        triggers=["command_success:Lint"],
+        loop_detection=True,
+    ),
+    CommandConfig(
+        name="Report",
+        command="echo '📊 Reporting...'; sleep 0.1",
+        triggers=["command_success:Test"],
+        loop_detection=True,
+    ),
+)
+
+DIAMOND_COMMANDS = (
+    CommandConfig(
+        name="Build",
+        command="echo '🔨 Building...'",
+        triggers=["build"],
+        loop_detection=True,
+    ),
+    CommandConfig(
+        name="Test",
+        command="echo '🧪 Testing...'",
+        triggers=["command_success:Build"],
+        loop_detection=True,
+    ),
+    CommandConfig(
+        name="Lint",
+        command="echo '🔍 Linting...'",
+        triggers=["command_success:Build"],
+        loop_detection=True,
+    ),
+    CommandConfig(
+        name="Report",
+        command="echo '📊 Reporting...'",
+        triggers=["command_success:Test", "command_success:Lint"],
+        loop_detection=True,
+    ),
+)
+
 
 async def main():
     """Demonstrate cycle detection."""
@@ -25,29 +102,16 @@ async def main():
     print("   Commands: A → B → A (would create infinite loop)")
     print()
 
-    commands = [
-        CommandConfig(
-            name="A",
-            command="echo 'A executed'",
-            triggers=["start", "command_success:B"],
-            loop_detection=True,  # Prevent cycles
-        ),
-        CommandConfig(
-            name="B",
-            command="echo 'B executed'",
-            triggers=["command_success:A"],
-            loop_detection=True,  # Prevent cycles
-        ),
-    ]
-
-    config = RunnerConfig(commands=commands, vars={})
+    # One orchestrator is shared by all sections; later sections swap in
+    # their own commands with reload_all_commands()
+    config = RunnerConfig(commands=list(CYCLE_COMMANDS), vars={})
     orchestrator = CommandOrchestrator(config)
 
     print("   Starting workflow: trigger('start')...")
     await orchestrator.trigger("start")
 
-    # Wait for commands to settle
-    await asyncio.sleep(0.5)
+    # Wait for commands to settle: wakes once, when the last run in the chain ends
+    await orchestrator.wait_until_idle(timeout=5.0)
 
     history_a = orchestrator.get_history("A")
     history_b = orchestrator.get_history("B")
@@ -61,27 +125,11 @@ async def main():
     print("   Triggering A and B separately - each completes normally")
     print()
 
-    # Reset by creating fresh orchestrator
-    commands = [
-        CommandConfig(
-            name="TaskX",
-            command="echo 'X'; sleep 0.1",
-            triggers=["task_x"],
-        ),
-        CommandConfig(
-            name="TaskY",
-            command="echo 'Y'; sleep 0.1",
-            triggers=["task_y"],
-        ),
-    ]
-
-    config = RunnerConfig(commands=commands, vars={})
-    orchestrator = CommandOrchestrator(config)
+    orchestrator.reload_all_commands(INDEPENDENT_COMMANDS)
 
-    # Trigger them independently
-    await orchestrator.trigger("task_x")
-    await orchestrator.trigger("task_y")
-    await asyncio.sleep(0.3)
+    # Trigger them independently (and concurrently)
+    await asyncio.gather(orchestrator.trigger("task_x"), orchestrator.trigger("task_y"))
+    await orchestrator.wait_until_idle(timeout=5.0)
 
     print("   ✓ TaskX completed")
     print("   ✓ TaskY completed independently\n")
@@ -91,33 +139,15 @@ async def main():
     print("   No cycles: each command runs once in sequence")
     print()
 
-    commands = [
-        CommandConfig(
-            name="Lint",
-            command="echo '🔍 Linting...'; sleep 0.1",
-            triggers=["start"],
-            loop_detection=True,
-        ),
-        CommandConfig(
-            name="Test",
-            command="echo '🧪 Testing...'; sleep 0.1",
-            triggers=["command_success:Lint"],
-            loop_detection=True,
-        ),
-        CommandConfig(
-            name="Report",
-            command="echo '📊 Reporting...'; sleep 0.1",
-            triggers=["command_success:Test"],
-            loop_detection=True,
-        ),
-    ]
-
-    config = RunnerConfig(commands=commands, vars={})
-    orchestrator = CommandOrchestrator(config)
+    orchestrator.reload_all_commands(CHAIN_COMMANDS)
+
+    # Report ends the chain, so wait for its success instead of a fixed delay
+    chain_done = asyncio.Event()
+    orchestrator.on_event("command_success:Report", lambda handle, context: chain_done.set())
 
     print("   Triggering workflow...")
     await orchestrator.trigger("start")
-    await asyncio.sleep(0.5)
+    await asyncio.wait_for(chain_done.wait(), timeout=5.0)
 
     lint_history = orchestrator.get_history("Lint")
     test_history = orchestrator.get_history("Test")
@@ -133,39 +163,11 @@ async def main():
     print("   Build → (Test + Lint) → Report (safe - no cycles)")
     print()
 
-    commands = [
-        CommandConfig(
-            name="Build",
-            command="echo '🔨 Building...'",
-            triggers=["build"],
-            loop_detection=True,
-        ),
-        CommandConfig(
-            name="Test",
-            command="echo '🧪 Testing...'",
-            triggers=["command_success:Build"],
-            loop_detection=True,
-        ),
-        CommandConfig(
-            name="Lint",
-            command="echo '🔍 Linting...'",
-            triggers=["command_success:Build"],
-            loop_detection=True,
-        ),
-        CommandConfig(
-            name="Report",
-            command="echo '📊 Reporting...'",
-            triggers=["command_success:Test", "command_success:Lint"],
-            loop_detection=True,
-        ),
-    ]
-
-    config = RunnerConfig(commands=commands, vars={})
-    orchestrator = CommandOrchestrator(config)
+    orchestrator.reload_all_commands(DIAMOND_COMMANDS)
 
     print("   Building → Both Test and Lint → Report")
     await orchestrator.trigger("build")
-    await asyncio.sleep(0.3)
+    await orchestrator.wait_until_idle(timeout=5.0)
 
     build_runs = len(orchestrator.get_history("Build"))
     test_runs = len(orchestrator.get_history("Test"))
@@ -11,17 +11,22 @@ import logging
 from cmdorc import (
     CommandConfig,
     CommandOrchestrator,
+    RunHandle,
+    RunnerConfig,
     disable_logging,
     get_log_file_path,
     setup_logging,
 )
 
 
-async def main():
-    # Example 1: Basic console + file logging
-    print("=== Example 1: Console + File Logging ===")
-    setup_logging(level="DEBUG", file=True)
+async def run_and_wait(orch: CommandOrchestrator, name: str) -> RunHandle:
+    """Start a command and wait for it to finish."""
+    handle = await orch.run_command(name)
+    await handle.wait()
+    return handle
+
 
+async def main():
     commands = [
         CommandConfig(
             name="Test",
@@ -30,10 +35,18 @@ async def main():
         )
     ]
 
-    async with CommandOrchestrator(commands=commands) as orch:
-        handle = await orch.run_command("Test")
-        await handle.wait()
-        print(f"Result: {handle.state.value}")
+    # One orchestrator serves every example; only the logging setup changes between runs
+    async with CommandOrchestrator(RunnerConfig(commands=commands)) as orch:
+        await run_examples(orch)
+
+
+async def run_examples(orch: CommandOrchestrator) -> None:
+    # Example 1: Basic console + file logging
+    print("=== Example 1: Console + File Logging ===")
+    setup_logging(level="DEBUG", file=True)
+
+    handle = await run_and_wait(orch, "Test")
+    print(f"Result: {handle.state.value}")
 
     print(f"Log file: {get_log_file_path()}\n")
 
@@ -41,8 +54,7 @@ async def main():
     print("=== Example 2: Custom Format ===")
     setup_logging(level="INFO", format_string="[%(levelname)s] %(message)s")
 
-    async with CommandOrchestrator(commands=commands) as orch:
-        await (await orch.run_command("Test")).wait()
+    await run_and_wait(orch, "Test")
 
     # Example 3: Prevent double-logging (if you have root configured)
     print("\n=== Example 3: With propagate=False ===")
@@ -53,23 +65,20 @@ async def main():
     # With propagate=False, only our handler outputs
     setup_logging(level="DEBUG", propagate=False)
 
-    async with CommandOrchestrator(commands=commands) as orch:
-        await (await orch.run_command("Test")).wait()
+    await run_and_wait(orch, "Test")
 
     # Example 4: Detailed format (includes file:line)
     print("\n=== Example 4: Detailed Format ===")
     setup_logging(level="INFO", format="detailed")
 
-    async with CommandOrchestrator(commands=commands) as orch:
-        await (await orch.run_command("Test")).wait()
+    await run_and_wait(orch, "Test")
 
     # Example 5: File only (no console)
     print("\n=== Example 5: File Only (No Console) ===")
     setup_logging(level="DEBUG", console=False, file=True)
     print("Logging to file only - no console output from cmdorc")
 
-    async with CommandOrchestrator(commands=commands) as orch:
-        await (await orch.run_command("Test")).wait()
+    await run_and_wait(orch, "Test")
 
     print(f"Check {get_log_file_path()} for logs")
 
@@ -78,8 +87,7 @@ async def main():
     disable_logging()
     print("Logging disabled - no cmdorc output will appear")
 
-    async with CommandOrchestrator(commands=commands) as orch:
-        await (await orch.run_command("Test")).wait()
+    await run_and_wait(orch, "Test")
 
     print("Command ran but no logs appeared")
 
@@ -98,8 +106,7 @@ async def main():
 
     app_logger.info("Application starting")
 
-    async with CommandOrchestrator(commands=commands) as orch:
-        await (await orch.run_command("Test")).wait()
+    await run_and_wait(orch, "Test")
 
     app_logger.info("Application finished")
 
@@ -44,8 +44,9 @@ async def main():
     # Step 5: Check the result
     print(f"Command completed with state: {handle.state}")
     print(f"Success: {handle.success}")
-    if handle.output:
-        print(f"Output: {handle.output}")
+    output = handle.output
+    if output:
+        print(f"Output: {output}")
 
     # Step 6: Clean up
     # Always shutdown the orchestrator to release resources
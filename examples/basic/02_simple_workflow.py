@@ -52,9 +52,9 @@ async def main():
 
     # Step 4: Wait for everything to complete
     # In a real application, you might do other work here (like handle UI events)
-    # For this example, we just sleep to let the workflow finish
+    # wait_until_idle() returns once Lint and the Test run it triggers have finished
     print("Waiting for workflow to complete...")
-    await asyncio.sleep(1.5)
+    await orchestrator.wait_until_idle(timeout=5.0)
 
     # Step 5: Check status after workflow completes
     lint_status = orchestrator.get_status("Lint")
@@ -28,7 +28,8 @@ async def main():
     config_path = Path(__file__).parent / "config.toml"
     print(f"Loading configuration from {config_path.name}...")
 
-    config = load_config(config_path)
+    # Parse the file in a worker thread so the event loop is not blocked by file I/O
+    config = await asyncio.to_thread(load_config, config_path)
 
     # Step 2: Create orchestrator from loaded config
     orchestrator = CommandOrchestrator(config)
@@ -46,20 +47,21 @@ async def main():
     await asyncio.sleep(0.5)
 
     # Step 6: Show status of all commands
+    # Take one snapshot of every status, then report from it
+    statuses = orchestrator.get_all_statuses()
     print("\nCommand Status:")
-    for command_name in commands:
-        status = orchestrator.get_status(command_name)
+    for command_name, status in statuses.items():
         print(f"  {command_name}: {status.state}")
 
     # Step 7: Trigger Test after Lint completes
     # (In the TOML config, Test has trigger "command_success:Lint")
     print("\nWaiting for workflow chain to complete...")
-    await asyncio.sleep(1.0)
+    await orchestrator.wait_until_idle(timeout=5.0)
 
     # Step 8: Show final status
+    statuses = orchestrator.get_all_statuses()
     print("\nFinal Status:")
-    for command_name in commands:
-        status = orchestrator.get_status(command_name)
+    for command_name, status in statuses.items():
         print(f"  {command_name}: {status.state}")
     # Step Clean up
     await orchestrator.shutdown()
@@ -36,6 +36,8 @@ async def main():
         triggers=["greet"],
         # Command-specific variables (can override global)
         vars={"name": "Developer", "environment": "cmdorc"},
+        # Unlimited concurrency: the two Greet runs below overlap
+        max_concurrent=0,
     )
 
     # Command 2: Uses environment variables
@@ -62,42 +64,48 @@ async def main():
     )
     orchestrator = CommandOrchestrator(config)
 
-    # Step 3: Run command with global/command variables
-    print("1. Running with global and command-specific variables:")
+    # Step 3: Start all four runs
+    # They are independent, so they run concurrently; run_command() returns as
+    # soon as a run has started
+    # Ensure HOME is in environment (used by ShowPath)
+    if "HOME" not in os.environ:
+        os.environ["HOME"] = "/home/user"
+
     handle1 = await orchestrator.run_command("Greet")
-    await handle1.wait(timeout=5.0)
+    handle2 = await orchestrator.run_command("ShowPath")
+    handle3 = await orchestrator.run_command(
+        "Greet",
+        vars={"name": "Alice"},  # Override global variable
+    )
+    handle4 = await orchestrator.run_command(
+        "Priority",
+        vars={"env": "production"},  # Override global
+    )
+
+    # Step 4: Wait for all runs together
+    await asyncio.gather(*(h.wait(timeout=5.0) for h in (handle1, handle2, handle3, handle4)))
+
+    # Step 5: Show each result
+    print("1. Running with global and command-specific variables:")
+    print(f"   {handle1.output.strip()}")
     print()
 
-    # Step 4: Run command with environment variables
     print("2. Running with environment variables ($HOME):")
-    # Ensure HOME is in environment
-    if "HOME" not in os.environ:
-        os.environ["HOME"] = "/home/user"
-    handle2 = await orchestrator.run_command("ShowPath")
-    await handle2.wait(timeout=5.0)
+    print(f"   {handle2.output.strip()}")
     print()
 
-    # Step 5: Run command with runtime variables (highest priority)
     print("3. Running with runtime variable override:")
     print("   Original 'name' value: User (global)")
     print("   Override with runtime vars: Alice")
-    handle3 = await orchestrator.run_command(
-        "Greet",
-        vars={"name": "Alice"},  # Override global variable
-    )
-    await handle3.wait(timeout=5.0)
+    print(f"   {handle3.output.strip()}")
     print()
 
-    # Step 6: Demonstrate variable priority
     print("4. Demonstrating variable priority:")
     print("   'env' is in global vars (development)")
     print("   'mode' is in command vars (default)")
     print("   Running with runtime override for 'env' (production):")
-    handle4 = await orchestrator.run_command(
-        "Priority",
-        vars={"env": "production"},  # Override global
-    )
-    await handle4.wait(timeout=5.0)
+    for line in handle4.output.splitlines():
+        print(f"   {line}")
     print()
     # Step Clean up
     await orchestrator.shutdown()
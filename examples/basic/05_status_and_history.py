@@ -26,7 +26,7 @@ async def main():
         name="Counter",
         command="echo 'Run count'",
         triggers=["counter"],
-        keep_history=5,  # Keep last 5 runs
+        keep_in_memory=5,  # Keep last 5 runs in history
     )
 
     config = RunnerConfig(commands=[count_config], vars={})
@@ -50,8 +50,10 @@ async def main():
 
     # Step 4: Wait for all runs to complete
     print("\nWaiting for all runs to complete...")
-    await asyncio.gather(*[h.wait(timeout=5.0) for h in handles])
-    await asyncio.sleep(0.2)  # Give time for state updates
+    await asyncio.gather(*(h.wait(timeout=5.0) for h in handles))
+    # A handle completes before the orchestrator finishes its bookkeeping
+    # (status, history, active handles); wait for that instead of sleeping
+    await orchestrator.wait_until_idle(timeout=5.0)
 
     # Step 5: Check status after runs
     print("\nStatus After Runs:")
@@ -16,6 +16,8 @@ Try it:
 # ruff: noqa: T201
 
 import asyncio
+import os
+import signal
 from pathlib import Path
 
 from watchdog.events import FileModifiedEvent, FileSystemEventHandler
@@ -23,6 +25,15 @@ from watchdog.observers import Observer
 
 from cmdorc import CommandOrchestrator, load_config
 
+# Directory of this example (config.toml lives here; its parent is watched)
+HERE = Path(__file__).parent
+
+# File suffixes that trigger a run; str.endswith() accepts the tuple directly
+WATCH_SUFFIXES = (".py",)
+
+# Modify events within this window (one editor save) start a single test run
+COALESCE_SECONDS = 0.05
+
 
 class PythonFileHandler(FileSystemEventHandler):
     """Watch for Python file changes and trigger tests."""
@@ -30,29 +41,49 @@ class PythonFileHandler(FileSystemEventHandler):
     def __init__(self, orchestrator):
         """Initialize with orchestrator."""
         self.orchestrator = orchestrator
+        self._loop = asyncio.get_running_loop()
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
 
     def on_modified(self, event: FileModifiedEvent):
-        """Called when a file is modified."""
+        """Called on watchdog's observer thread when a file is modified."""
         if event.is_directory:
             return
 
         # Only trigger on Python files
-        if event.src_path.endswith(".py"):
-            filename = Path(event.src_path).name
-            print(f"📝 {filename} changed")
-
-            # Trigger the test command
-            # Debounce in config prevents rapid re-runs
-            asyncio.create_task(self.orchestrator.trigger("file_changed"))
+        if event.src_path.endswith(WATCH_SUFFIXES):
+            self._loop.call_soon_threadsafe(self._changed, os.path.basename(event.src_path))
+
+    def _changed(self, filename: str):
+        """Run the tests once per burst of changes (runs on the loop)."""
+        print(f"📝 {filename} changed")
+        # Debounce in config prevents rapid re-runs across bursts
+        if self._timer is None:
+            self._timer = self._loop.call_later(COALESCE_SECONDS, self._fire)
+
+    def _fire(self):
+        """Send one file_changed trigger for the burst (runs on the loop)."""
+        self._timer = None
+        task = self._loop.create_task(self.orchestrator.trigger("file_changed"))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def drain(self):
+        """Skip a test run still in its coalescing window; await triggers already sent."""
+        await asyncio.sleep(0)
+        if self._timer is not None:
+            self._timer.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
 
 
 async def main():
     """Watch Python files and auto-run tests."""
 
     # Step 1: Load test configuration
-    config_path = Path(__file__).parent / "config.toml"
+    config_path = HERE / "config.toml"
     print(f"Loading test config from {config_path.name}...")
-    config = load_config(config_path)
+    # Parse the file in a worker thread so the event loop is not blocked by file I/O
+    config = await asyncio.to_thread(load_config, config_path)
     orchestrator = CommandOrchestrator(config)
 
     # Step 2: Set up file watcher
@@ -60,25 +91,25 @@ async def main():
     observer = Observer()
 
     # Watch the parent directory (file_watching)
-    watch_path = Path(__file__).parent.parent
+    watch_path = HERE.parent
     observer.schedule(event_handler, str(watch_path), recursive=False)
 
     # Step 3: Set up callbacks for feedback
-    async def on_test_success(handle, context):
+    # Lifecycle callbacks receive the run's handle (on_event callbacks for
+    # command_* events do not), so the run's own timing is available
+    def on_test_success(handle, context):
         """Called when tests pass."""
-        duration = (
-            f"{handle.end_time - handle.start_time:.2f}s"
-            if handle.end_time and handle.start_time
-            else "unknown"
-        )
-        print(f"  ✓ Tests passed ({duration})")
-
-    async def on_test_failure(handle, context):
+        print(f"  ✓ Tests passed ({handle.duration_str})")
+
+    def on_test_failure(handle, context):
         """Called when tests fail."""
         print("  ✗ Tests failed - fix the issues and save to retry")
 
-    orchestrator.on_event("command_success:RunTests", on_test_success)
-    orchestrator.on_event("command_failed:RunTests", on_test_failure)
+    orchestrator.set_lifecycle_callback(
+        "RunTests",
+        on_success=on_test_success,
+        on_failed=on_test_failure,
+    )
 
     # Step 4: Start watching
     print(f"🔍 Watching {watch_path} for Python file changes...")
@@ -88,17 +119,25 @@ async def main():
 
     observer.start()
 
-    # Step 5: Keep running
+    # Step 5: Keep running until Ctrl+C (SIGINT) or SIGTERM
+    # The signal handlers set an event, so the loop sleeps until there is work to do
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:  # Windows: Ctrl+C raises KeyboardInterrupt instead
+            pass
     try:
-        while True:
-            await asyncio.sleep(0.1)
+        await stop.wait()
     except KeyboardInterrupt:
-        print("\n🛑 Stopping watcher...")
+        pass
+    print("\n🛑 Stopping watcher...")
 
     # Step 6: Clean up
     observer.stop()
     observer.join()
-    await asyncio.sleep(0.1)
+    await event_handler.drain()
     await orchestrator.shutdown()
     print("✅ Auto-tester stopped")
 
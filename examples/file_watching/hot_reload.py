@@ -20,6 +20,8 @@ Try it:
 # ruff: noqa: T201
 
 import asyncio
+import os
+import signal
 from pathlib import Path
 
 from watchdog.events import FileModifiedEvent, FileSystemEventHandler
@@ -27,6 +29,12 @@ from watchdog.observers import Observer
 
 from cmdorc import CommandConfig, CommandOrchestrator, RunnerConfig
 
+# File suffixes that trigger a run; str.endswith() accepts the tuple directly
+WATCH_SUFFIXES = (".py",)
+
+# A save's burst of modify events within this window restarts the server once
+COALESCE_SECONDS = 0.05
+
 
 class ServerFileHandler(FileSystemEventHandler):
     """Watch for code changes and restart server."""
@@ -34,18 +42,36 @@ class ServerFileHandler(FileSystemEventHandler):
     def __init__(self, orchestrator):
         """Initialize with orchestrator."""
         self.orchestrator = orchestrator
+        self._loop = asyncio.get_running_loop()
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
         self.last_restart = 0.0
 
     def on_modified(self, event: FileModifiedEvent):
-        """Called when a file is modified."""
-        if event.is_directory or not event.src_path.endswith(".py"):
+        """Called on watchdog's observer thread when a file is modified."""
+        if event.is_directory or not event.src_path.endswith(WATCH_SUFFIXES):
             return
+        self._loop.call_soon_threadsafe(self._changed, os.path.basename(event.src_path))
 
-        filename = Path(event.src_path).name
+    def _changed(self, filename: str):
+        """Restart the server once per burst of changes (runs on the loop)."""
         print(f"📝 {filename} changed - restarting server...")
+        if self._timer is None:
+            self._timer = self._loop.call_later(COALESCE_SECONDS, self._fire)
+
+    def _fire(self):
+        """Send one code_changed trigger for the burst (runs on the loop)."""
+        self._timer = None
+        task = self._loop.create_task(self.orchestrator.trigger("code_changed"))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
 
-        # Trigger restart
-        asyncio.create_task(self.orchestrator.trigger("code_changed"))
+    async def drain(self):
+        """Skip a restart still in its coalescing window; await triggers already sent."""
+        await asyncio.sleep(0)
+        if self._timer is not None:
+            self._timer.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
 
 
 async def main():
@@ -76,11 +102,16 @@ async def main():
     orchestrator = CommandOrchestrator(config)
 
     # Step 3: Set up callbacks
-    async def on_server_start(handle, context):
+    # These only print, so they are plain functions called inline.
+    # Event callbacks receive handle=None, so the run is looked up by command name
+    # (the newest active handle; the previous run may still be shutting down)
+    def on_server_start(handle, context):
         """Server started."""
-        print(f"  ✓ Server started (run_id={handle.run_id[:8]}...)")
+        active = orchestrator.get_active_handles("DevServer")
+        if active:
+            print(f"  ✓ Server started (run_id={active[-1].short_id}...)")
 
-    async def on_server_cancel(handle, context):
+    def on_server_cancel(handle, context):
         """Server was restarted."""
         print("  ⊘ Server stopped for restart")
 
@@ -103,17 +134,25 @@ async def main():
     observer.start()
     await orchestrator.trigger("start")
 
-    # Step 6: Keep running until interrupted
+    # Step 6: Keep running until Ctrl+C (SIGINT) or SIGTERM
+    # The signal handlers set an event, so the loop sleeps until there is work to do
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:  # Windows: Ctrl+C raises KeyboardInterrupt instead
+            pass
     try:
-        while True:
-            await asyncio.sleep(0.1)
+        await stop.wait()
     except KeyboardInterrupt:
-        print("\n\n🛑 Shutting down...")
+        pass
+    print("\n\n🛑 Shutting down...")
 
     # Step 7: Clean up
     observer.stop()
     observer.join()
-    await asyncio.sleep(0.1)
+    await event_handler.drain()
     await orchestrator.shutdown(timeout=5.0, cancel_running=True)
     print("✅ Hot-reload server stopped")
 
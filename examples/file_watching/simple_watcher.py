@@ -19,6 +19,8 @@ Try it:
 # ruff: noqa: T201
 
 import asyncio
+import os
+import signal
 from pathlib import Path
 
 from watchdog.events import FileModifiedEvent, FileSystemEventHandler
@@ -26,6 +28,13 @@ from watchdog.observers import Observer
 
 from cmdorc import CommandConfig, CommandOrchestrator, RunnerConfig
 
+# File suffixes that trigger a run; str.endswith() accepts the tuple directly
+WATCH_SUFFIXES = (".py",)
+
+# Editors often emit several modify events per save; events within this
+# window are coalesced into a single trigger
+COALESCE_SECONDS = 0.05
+
 
 class FileChangeHandler(FileSystemEventHandler):
     """Handle file system events and trigger cmdorc commands."""
@@ -33,17 +42,36 @@ class FileChangeHandler(FileSystemEventHandler):
     def __init__(self, orchestrator):
         """Initialize with orchestrator instance."""
         self.orchestrator = orchestrator
+        self._loop = asyncio.get_running_loop()
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
 
     def on_modified(self, event: FileModifiedEvent):
-        """Called when a file is modified."""
-        if not event.is_directory and event.src_path.endswith(".py"):
-            # Extract just the filename for logging
-            filename = Path(event.src_path).name
-            print(f"📝 {filename} changed")
-
-            # Trigger the build command
-            # This runs asynchronously in the background
-            asyncio.create_task(self.orchestrator.trigger("file_changed"))
+        """Called on watchdog's observer thread when a file is modified."""
+        if not event.is_directory and event.src_path.endswith(WATCH_SUFFIXES):
+            # Hand the event to the loop; the handler's state is only touched there
+            filename = os.path.basename(event.src_path)
+            self._loop.call_soon_threadsafe(self._changed, filename)
+
+    def _changed(self, filename: str):
+        """Log a change and trigger once per burst of events (runs on the loop)."""
+        print(f"📝 {filename} changed")
+        if self._timer is None:
+            self._timer = self._loop.call_later(COALESCE_SECONDS, self._fire)
+
+    def _fire(self):
+        """Trigger the command once for the coalesced burst (runs on the loop)."""
+        self._timer = None
+        task = self._loop.create_task(self.orchestrator.trigger("file_changed"))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def drain(self):
+        """After the observer stops, drop an unfired trigger and await the started ones."""
+        await asyncio.sleep(0)  # Run any _changed() calls the observer queued
+        if self._timer is not None:
+            self._timer.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
 
 
 async def main():
@@ -81,17 +109,25 @@ async def main():
 
     observer.start()
 
-    # Step 5: Keep running until interrupted
+    # Step 5: Keep running until Ctrl+C (SIGINT) or SIGTERM
+    # The signal handlers set an event, so the loop sleeps until there is work to do
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:  # Windows: Ctrl+C raises KeyboardInterrupt instead
+            pass
     try:
-        while True:
-            await asyncio.sleep(0.1)
+        await stop.wait()
     except KeyboardInterrupt:
-        print("\n\n🛑 Stopping watcher...")
+        pass
+    print("\n\n🛑 Stopping watcher...")
 
     # Step 6: Clean up
     observer.stop()
     observer.join()
-    await asyncio.sleep(0.1)
+    await event_handler.drain()
     await orchestrator.shutdown()
     print("✅ Watcher stopped")
 
@@ -21,7 +21,9 @@ Try it:
 import asyncio
 from pathlib import Path
 
-from cmdorc import CommandOrchestrator, load_config
+from cmdorc import CommandOrchestrator, load_config, run_with_uvloop
+
+SEP = "=" * 50
 
 
 async def main():
@@ -30,7 +32,8 @@ async def main():
     # Step 1: Load CI configuration
     config_path = Path(__file__).parent / "ci.toml"
     print(f"Loading CI pipeline configuration from {config_path.name}...")
-    config = load_config(config_path)
+    # Parse the file in a worker thread so the event loop is not blocked by file I/O
+    config = await asyncio.to_thread(load_config, config_path)
     orchestrator = CommandOrchestrator(config)
 
     # Step 2: Display pipeline configuration
@@ -43,77 +46,75 @@ async def main():
         """Called when any critical stage fails."""
         print("\n⚠️  Pipeline failure notification triggered")
 
-    orchestrator.on_event("command_failed:*", on_pipeline_failure)
+    orchestrator.on_command_failed(on_pipeline_failure)
 
     # Step 4: Start the pipeline
     print("\nStarting CI pipeline...")
     await orchestrator.trigger("start")
 
     # Step 5: Wait for pipeline to complete
-    # Monitor status while pipeline runs
+    # wait_until_idle() returns as soon as the last stage (and anything it
+    # triggers) has finished; a background task prints progress meanwhile
     max_wait = 10.0  # seconds
-    elapsed = 0.0
-    check_interval = 0.5
-
-    while elapsed < max_wait:
-        await asyncio.sleep(check_interval)
-        elapsed += check_interval
-
-        # Check if any stages are still running
-        active_handles = orchestrator.get_all_active_handles()
-        if not active_handles:
-            break
-
-        # Show progress
-        if int(elapsed) % 2 == 0:
-            print(f"  [{elapsed:.1f}s] {len(active_handles)} stage(s) running...")
+    progress_interval = 2.0
+    loop = asyncio.get_running_loop()
+    started_at = loop.time()
+
+    async def report_progress():
+        """Print the number of running stages every progress_interval seconds."""
+        next_print_at = progress_interval
+        while True:
+            # Sleep until the next scheduled print, so the schedule does not drift
+            await asyncio.sleep(next_print_at - (loop.time() - started_at))
+            active_handles = orchestrator.get_all_active_handles()
+            print(f"  [{next_print_at:.1f}s] {len(active_handles)} stage(s) running...")
+            next_print_at += progress_interval
+
+    progress = asyncio.create_task(report_progress())
+    try:
+        await orchestrator.wait_until_idle(timeout=max_wait)
+    except asyncio.TimeoutError:
+        print(f"  [{max_wait:.1f}s] Gave up waiting for the pipeline")
+    finally:
+        progress.cancel()
 
     # Step 6: Collect final results
-    print("\n" + "=" * 50)
-    print("PIPELINE RESULTS")
-    print("=" * 50)
+    print(f"\n{SEP}\nPIPELINE RESULTS\n{SEP}")
 
+    # The pipeline is idle, so one status snapshot covers the whole report
+    statuses = orchestrator.get_all_statuses()
     pipeline_success = True
-    for stage_name in commands:
-        status = orchestrator.get_status(stage_name)
-        # Check if stage ran and succeeded
-        ran = status.state != "never_run"
-        success = status.state == "success"
-
-        if ran:
-            symbol = "✓" if success else "✗"
-            state_display = status.state.upper()
-            print(f"{symbol} {stage_name:15} {state_display}")
-
-            if not success:
-                pipeline_success = False
+    for stage_name, status in statuses.items():
+        # Skip stages that never ran; any other non-success state fails the pipeline
+        state = status.state
+        if state == "never_run":
+            continue
+        success = state == "success"
+        print(f"{'✓' if success else '✗'} {stage_name:15} {state.upper()}")
+        if not success:
+            pipeline_success = False
 
     # Step 7: Show execution history for debugging
-    print("\n" + "=" * 50)
-    print("DETAILED HISTORY")
-    print("=" * 50)
+    print(f"\n{SEP}\nDETAILED HISTORY\n{SEP}")
 
     for stage_name in commands:
         history = orchestrator.get_history(stage_name, limit=1)
         if history:
             result = history[0]
-            duration = (
-                f"{result.end_time - result.start_time:.2f}s"
-                if result.start_time and result.end_time
-                else "N/A"
-            )
-            print(f"{stage_name:15} run_id={result.run_id[:8]}... duration={duration}")
+            # duration_str is "-" for runs that never started
+            print(f"{stage_name:15} run_id={result.run_id[:8]}... duration={result.duration_str}")
 
     # Step 8: Final status
-    print("\n" + "=" * 50)
+    print(f"\n{SEP}")
     if pipeline_success:
         print("✅ Pipeline completed successfully")
     else:
         print("❌ Pipeline failed - check stages above")
-    print("=" * 50)
+    print(SEP)
     # Step Clean up
     await orchestrator.shutdown(timeout=5.0, cancel_running=True)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Same as asyncio.run(main()) unless uvloop is installed (pip install uvloop)
+    run_with_uvloop(main())
@@ -68,39 +68,48 @@ async def main():
     orchestrator = CommandOrchestrator(config)
 
     # Step 3: Set up callbacks for workflow feedback
-    async def on_started(handle, context):
+    # These only print, so they are plain functions: sync callbacks are called
+    # inline, without creating and awaiting a coroutine per event.
+    # Event callbacks receive handle=None; the event that fired is the last entry
+    # of the trigger chain (e.g. "command_success:PreCommitLint").
+    def command_name(context):
+        """Return the command name from the event that invoked the callback."""
+        return context.history[-1].partition(":")[2]
+
+    def on_started(handle, context):
         """Log when commands start."""
-        print(f"  → {handle.command_name} started")
+        print(f"  → {command_name(context)} started")
 
-    async def on_success(handle, context):
+    def on_success(handle, context):
         """Log successes."""
-        print(f"  ✓ {handle.command_name} succeeded")
+        print(f"  ✓ {command_name(context)} succeeded")
 
-    async def on_failure(handle, context):
+    def on_failure(handle, context):
         """Log failures and suggest actions."""
-        print(f"  ✗ {handle.command_name} failed")
+        print(f"  ✗ {command_name(context)} failed")
         print("    Action: Check your code and try again")
 
-    async def on_cancel(handle, context):
+    def on_cancel(handle, context):
         """Log cancellations."""
-        print(f"  ⊘ {handle.command_name} was cancelled")
+        print(f"  ⊘ {command_name(context)} was cancelled")
 
-    orchestrator.on_event("command_started:*", on_started)
-    orchestrator.on_event("command_success:*", on_success)
-    orchestrator.on_event("command_failed:*", on_failure)
-    orchestrator.on_event("command_cancelled:*", on_cancel)
+    orchestrator.on_command_started(on_started)
+    orchestrator.on_command_success(on_success)
+    orchestrator.on_command_failed(on_failure)
+    orchestrator.on_command_cancelled(on_cancel)
 
     # Step 4: Simulate pre-commit workflow
     print("=" * 50)
     print("Pre-Commit Workflow")
     print("=" * 50)
     await orchestrator.trigger("pre-commit")
-    await asyncio.sleep(2.0)
+    # Returns once the whole chain (lint, then format) has finished
+    await orchestrator.wait_until_idle(timeout=10.0)
 
     # Step 5: Show status
+    # get_all_statuses() reads every command's status in one consistent pass
     print("\nWorkflow Status:")
-    for cmd_name in orchestrator.list_commands():
-        status = orchestrator.get_status(cmd_name)
+    for cmd_name, status in orchestrator.get_all_statuses().items():
         if status.state != "never_run":
             print(f"  {cmd_name}: {status.state}")
 
@@ -109,12 +118,11 @@ async def main():
     print("Pre-Push Workflow")
     print("=" * 50)
     await orchestrator.trigger("pre-push")
-    await asyncio.sleep(2.0)
+    await orchestrator.wait_until_idle(timeout=10.0)
 
     # Step 7: Final status
     print("\nFinal Status:")
-    for cmd_name in orchestrator.list_commands():
-        status = orchestrator.get_status(cmd_name)
+    for cmd_name, status in orchestrator.get_all_statuses().items():
         if status.state != "never_run":
             symbol = "✓" if status.state == "success" else "✗"
             print(f"  {symbol} {cmd_name}: {status.state}")
@@ -93,21 +93,32 @@ async def main():
     orchestrator = CommandOrchestrator(config)
 
     # Step 4: Set up event callbacks for real-time feedback
-    async def on_command_started(handle, context):
+    # These only print, so they are plain functions: sync callbacks are called
+    # inline, without creating and awaiting a coroutine per event.
+    # Event callbacks receive handle=None; the event that fired is the last entry
+    # of the trigger chain (e.g. "command_started:Lint").
+    def command_name(context):
+        """Return the command name from the event that invoked the callback."""
+        return context.history[-1].partition(":")[2]
+
+    def on_command_started(handle, context):
         """Called when a command starts."""
-        print(f"→ {handle.command_name} started (run_id={handle.run_id[:8]}...)")
+        name = command_name(context)
+        active = orchestrator.get_active_handles(name)  # Newest run is last
+        if active:
+            print(f"→ {name} started (run_id={active[-1].short_id}...)")
 
-    async def on_command_success(handle, context):
+    def on_command_success(handle, context):
         """Called when a command succeeds."""
-        print(f"✓ {handle.command_name} completed successfully")
+        print(f"✓ {command_name(context)} completed successfully")
 
-    async def on_command_failure(handle, context):
+    def on_command_failure(handle, context):
         """Called when a command fails."""
-        print(f"✗ {handle.command_name} failed")
+        print(f"✗ {command_name(context)} failed")
 
-    orchestrator.on_event("command_started:*", on_command_started)
-    orchestrator.on_event("command_success:*", on_command_success)
-    orchestrator.on_event("command_failed:*", on_command_failure)
+    orchestrator.on_command_started(on_command_started)
+    orchestrator.on_command_success(on_command_success)
+    orchestrator.on_command_failed(on_command_failure)
 
     # Step 5: Display available commands
     print("Available commands:")
@@ -121,21 +132,17 @@ async def main():
     await orchestrator.trigger(args.command)
 
     # Step 7: Wait for completion
+    # wait_until_idle() wakes once, when the last run (including chained ones) ends
     max_wait = 30.0
-    elapsed = 0.0
-    while elapsed < max_wait:
-        await asyncio.sleep(0.5)
-        elapsed += 0.5
-
-        active = orchestrator.get_all_active_handles()
-        if not active:
-            break
+    try:
+        await orchestrator.wait_until_idle(timeout=max_wait)
+    except asyncio.TimeoutError:
+        print(f"Gave up waiting after {max_wait:.0f}s")
 
     # Step 8: Show final status
     print("-" * 50)
     print("Final Status:")
-    for cmd_name in orchestrator.list_commands():
-        status = orchestrator.get_status(cmd_name)
+    for cmd_name, status in orchestrator.get_all_statuses().items():
         if status.state != "never_run":
             symbol = "✓" if status.state == "success" else "✗"
             print(f"  {symbol} {cmd_name}: {status.state}")
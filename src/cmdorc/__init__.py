@@ -1,6 +1,8 @@
 __version__ = "0.10.0"
 
+import importlib
 import logging
+from typing import TYPE_CHECKING, Any
 
 from .command_config import CommandConfig, OutputStorageConfig, RunnerConfig
 from .command_executor import CommandExecutor
@@ -19,14 +21,41 @@ from .exceptions import (
     VariableResolutionError,
 )
 from .load_config import load_config, load_configs
-from .local_subprocess_executor import LocalSubprocessExecutor
-from .logging_config import disable_logging, get_log_file_path, setup_logging
-from .mock_executor import MockExecutor
 from .run_handle import RunHandle
 from .run_result import ResolvedCommand, RunResult, RunState
 from .trigger_engine import TriggerEngine  # noqa: F401 - accessible but not in __all__
 from .types import CommandStatus, NewRunDecision, TriggerContext
-from .utils import format_duration
+from .utils import format_duration, run_with_uvloop
+
+if TYPE_CHECKING:
+    from .local_subprocess_executor import LocalSubprocessExecutor
+    from .logging_config import disable_logging, get_log_file_path, setup_logging
+    from .mock_executor import MockExecutor
+
+# Names imported on first access (PEP 562), so "import cmdorc" skips their modules
+# (and logging.handlers) until used. CommandOrchestrator imports
+# LocalSubprocessExecutor itself when no executor is passed.
+_LAZY_IMPORTS = {
+    "LocalSubprocessExecutor": ".local_subprocess_executor",
+    "MockExecutor": ".mock_executor",
+    "disable_logging": ".logging_config",
+    "get_log_file_path": ".logging_config",
+    "setup_logging": ".logging_config",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 # Library best practice: add NullHandler to prevent "No handler found" warnings
 logging.getLogger("cmdorc").addHandler(logging.NullHandler())
@@ -50,6 +79,7 @@ __all__ = [
     "TriggerContext",
     # Utilities
     "format_duration",
+    "run_with_uvloop",
     # Logging utilities
     "disable_logging",
     "get_log_file_path",
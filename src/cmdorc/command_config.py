@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import logging
-import re
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Literal
@@ -14,6 +13,20 @@ logger = logging.getLogger(__name__)
 # ─────────────────────────────────────────────────────────────────────────────
 # Trigger validation
 # ─────────────────────────────────────────────────────────────────────────────
+
+# Translation tables that delete the allowed punctuation. What remains of a
+# valid trigger is word characters only, which str.isalnum() checks in one C
+# loop (same Unicode set as regex \w, minus "_", which is deleted here).
+_TRIGGER_PUNCT = str.maketrans("", "", "_-:")
+_TRIGGER_PUNCT_WILDCARD = str.maketrans("", "", "_-:*")
+
+# Trigger names already known to be valid. Commands tend to share trigger names,
+# so config validation only has to scan each distinct name once.
+_VALIDATED_TRIGGERS: set[str] = set()
+_VALIDATED_WILDCARD_TRIGGERS: set[str] = set()
+_VALIDATED_CACHE_SIZE = 4096
+
+
 def validate_trigger(name: str, *, allow_wildcards: bool = False) -> str:
     """
     Validate a trigger name.
@@ -32,14 +45,15 @@ def validate_trigger(name: str, *, allow_wildcards: bool = False) -> str:
         - Colons (:) - for lifecycle events like "command_success:Name"
         - Asterisks (*) - only if allow_wildcards=True
     """
+    if name in (_VALIDATED_WILDCARD_TRIGGERS if allow_wildcards else _VALIDATED_TRIGGERS):
+        return name.strip()
     if not name:
         raise ConfigValidationError("Trigger name cannot be empty")
 
-    pattern = r"^[\w\-\:\*]+$"
-    if not allow_wildcards:
-        pattern = r"^[\w\-\:]+$"
-
-    if not re.match(pattern, name):
+    # As with a ^...$ regex match, one trailing newline is accepted (and stripped)
+    body = name[:-1] if name.endswith("\n") else name
+    rest = body.translate(_TRIGGER_PUNCT_WILDCARD if allow_wildcards else _TRIGGER_PUNCT)
+    if not body or (rest and not rest.isalnum()):
         allowed = (
             "alphanumerics, underscores, hyphens, and colons"
             if not allow_wildcards
@@ -47,9 +61,38 @@ def validate_trigger(name: str, *, allow_wildcards: bool = False) -> str:
         )
         raise ConfigValidationError(f"Invalid trigger name '{name}': must contain only {allowed}")
 
+    _remember_valid_trigger(name, allow_wildcards)
     return name.strip()
 
 
+def _remember_valid_trigger(name: str, allow_wildcards: bool) -> None:
+    """Record a validated trigger name, resetting the cache once it is full."""
+    cache = _VALIDATED_WILDCARD_TRIGGERS if allow_wildcards else _VALIDATED_TRIGGERS
+    if len(cache) >= _VALIDATED_CACHE_SIZE:
+        cache.clear()
+    cache.add(name)
+
+
+def _validate_triggers(names: list[str], *, allow_wildcards: bool = False) -> None:
+    """
+    Validate a list of trigger names in one loop.
+
+    Same rules as validate_trigger(), but the translation table is chosen once
+    and valid names cost no extra call; names validated before are skipped.
+    The first invalid name is handed to validate_trigger() to raise its usual error.
+    """
+    table = _TRIGGER_PUNCT_WILDCARD if allow_wildcards else _TRIGGER_PUNCT
+    validated = _VALIDATED_WILDCARD_TRIGGERS if allow_wildcards else _VALIDATED_TRIGGERS
+    for name in names:
+        if name in validated:
+            continue
+        body = name[:-1] if name.endswith("\n") else name
+        rest = body.translate(table)
+        if not body or (rest and not rest.isalnum()):
+            validate_trigger(name, allow_wildcards=allow_wildcards)
+        _remember_valid_trigger(name, allow_wildcards)
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Output Storage Configuration
 # ─────────────────────────────────────────────────────────────────────────────
@@ -122,11 +165,19 @@ class OutputStorageConfig:
         return self.keep_history != 0
 
 
-@dataclass(frozen=True)
+# Shared default (frozen, so safe to share): the disabled-storage default is used by
+# nearly every RunnerConfig and executor, and sharing it skips re-validating it each time
+DEFAULT_OUTPUT_STORAGE = OutputStorageConfig()
+
+
+@dataclass(frozen=True, slots=True)
 class CommandConfig:
     """
     Immutable configuration for a single command.
     Used both when loading from TOML and when passed programmatically.
+
+    Slotted (no per-instance __dict__), which keeps large TOML-loaded
+    command sets compact.
     """
 
     name: str
@@ -290,10 +341,8 @@ class CommandConfig:
             )
 
         # ────── Validate triggers ──────
-        for t in self.triggers:
-            validate_trigger(t, allow_wildcards=False)
-        for t in self.cancel_on_triggers:
-            validate_trigger(t, allow_wildcards=False)
+        _validate_triggers(self.triggers)
+        _validate_triggers(self.cancel_on_triggers)
 
         # ────── Validate per-command output overrides ──────
         if self.keep_history is not None and self.keep_history < -1:
@@ -331,10 +380,10 @@ class RunnerConfig:
     These act as defaults and can be overridden at runtime via CommandRunner.add_var()/set_vars().
     """
 
-    output_storage: OutputStorageConfig = field(default_factory=OutputStorageConfig)
+    output_storage: OutputStorageConfig = DEFAULT_OUTPUT_STORAGE
     """
     Output storage configuration for automatic file persistence.
-    Default: OutputStorageConfig() (disabled with keep_history=0)
+    Default: DEFAULT_OUTPUT_STORAGE, a shared OutputStorageConfig() (disabled with keep_history=0)
     """
 
     def __post_init__(self) -> None:
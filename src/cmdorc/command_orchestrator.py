@@ -20,8 +20,11 @@ Does NOT:
 from __future__ import annotations
 
 import asyncio
+import inspect
 import logging
-from collections.abc import Awaitable, Callable
+import sys
+from collections.abc import Awaitable, Callable, Coroutine
+from functools import lru_cache
 from typing import Any
 
 from .command_config import CommandConfig, RunnerConfig
@@ -44,6 +47,23 @@ from .types import CommandStatus, TriggerContext
 
 logger = logging.getLogger(__name__)
 
+# Python 3.12+ can start a task eagerly: it runs synchronously until its first
+# suspension instead of waiting for the next event loop iteration
+_EAGER_TASKS = sys.version_info >= (3, 12)
+
+# Final run state -> (lifecycle event type, lifecycle callback type)
+_COMPLETION_EVENTS: dict[RunState, tuple[str, str]] = {
+    RunState.SUCCESS: ("command_success", "on_success"),
+    RunState.FAILED: ("command_failed", "on_failed"),
+    RunState.CANCELLED: ("command_cancelled", "on_cancelled"),
+}
+
+
+@lru_cache(maxsize=1024)
+def _lifecycle_event(event_type: str, command_name: str) -> str:
+    """Return the interned lifecycle event name, e.g. "command_success:Tests"."""
+    return sys.intern(f"{event_type}:{command_name}")
+
 
 class CommandOrchestrator:
     """
@@ -58,6 +78,8 @@ class CommandOrchestrator:
         self,
         runner_config: RunnerConfig,
         executor: CommandExecutor | None = None,
+        *,
+        eager_tasks: bool = False,
     ) -> None:
         """
         Initialize orchestrator with configuration.
@@ -65,6 +87,8 @@ class CommandOrchestrator:
         Args:
             runner_config: RunnerConfig with commands and global variables
             executor: Optional custom executor (defaults to LocalSubprocessExecutor)
+            eager_tasks: Start background tasks eagerly on Python 3.12+ (ignored on
+                older versions). This changes callback ordering; see _spawn().
 
         Raises:
             ValueError: If RunnerConfig is invalid
@@ -92,6 +116,14 @@ class CommandOrchestrator:
         self._handles: dict[str, RunHandle] = {}
         self._handles_lock = asyncio.Lock()
 
+        # Set whenever the handle registry is empty (see wait_until_idle)
+        self._idle_event = asyncio.Event()
+        self._idle_event.set()
+
+        # Background tasks started via _spawn(); joined by shutdown()
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._eager_tasks = eager_tasks and _EAGER_TASKS
+
         # Orchestrator-level lock for critical sections
         # Prevents races in high-concurrency scenarios
         self._orchestrator_lock = asyncio.Lock()
@@ -250,9 +282,6 @@ class CommandOrchestrator:
         handle = RunHandle(result)
         await self._register_handle(handle)
 
-        # Emit command_started trigger (non-blocking background task)
-        asyncio.create_task(self._emit_auto_trigger(f"command_started:{name}", handle))
-
         # Update latest_run.toml with PENDING state
         self._executor.update_latest_run(result)
 
@@ -273,8 +302,8 @@ class CommandOrchestrator:
             await self._unregister_handle(result.run_id)
             raise
 
-        # Start monitoring task
-        asyncio.create_task(self._monitor_run(result, handle))
+        # Start monitoring task (emits command_started, then waits for completion)
+        self._spawn(self._monitor_run(result, handle))
 
         logger.debug(
             f"Started command '{name}' (run_id={result.run_id})",
@@ -305,9 +334,10 @@ class CommandOrchestrator:
         4. Check cycle detection
         5. Add event to context.seen (for cycle prevention)
         6. Release lock
-        7. Handle cancel_on_triggers matches
-        8. Handle triggers matches
-        9. Dispatch callbacks
+        7. Return early if no command or callback subscribes to the event
+        8. Handle cancel_on_triggers matches
+        9. Handle triggers matches
+        10. Dispatch callbacks
 
         Args:
             event_name: Event to trigger (e.g., "file_saved", "command_success:Tests")
@@ -340,7 +370,13 @@ class CommandOrchestrator:
 
         # Release lock before executing commands/callbacks
 
-        logger.debug(f"Trigger: {event_name} (chain: {' -> '.join(context.history)})")
+        # Every event passes through here; only build the chain string if it will be logged
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Trigger: {event_name} (chain: {' -> '.join(context.history)})")
+
+        # Fast path: no command or callback listens to this event
+        if not self._trigger_engine.has_subscribers(event_name):
+            return
 
         # Handle cancel_on_triggers matches
         cancel_matches = self._trigger_engine.get_matching_commands(
@@ -364,7 +400,7 @@ class CommandOrchestrator:
 
         # Handle triggers matches (execute matching commands)
         trigger_matches = self._trigger_engine.get_matching_commands(event_name, "triggers")
-        if trigger_matches:
+        if trigger_matches and logger.isEnabledFor(logging.DEBUG):
             matched_names = [c.name for c in trigger_matches]
             logger.debug(
                 f"Trigger '{event_name}' matched {len(trigger_matches)} command(s): {matched_names}"
@@ -390,6 +426,40 @@ class CommandOrchestrator:
     # Execution: Helpers
     # ========================================================================
 
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> asyncio.Task[None]:
+        """
+        Start an orchestrator background task (monitoring, auto-triggers).
+
+        By default the task first runs on the next event loop iteration, on
+        every Python version. So command_started callbacks run after
+        run_command() returns, and a run started by trigger() emits its
+        lifecycle events from its own task rather than from inside trigger().
+
+        With eager_tasks=True on Python 3.12+ the task instead runs inline until
+        its first suspension: command_started callbacks usually finish before
+        run_command() returns, and chained runs start recursively inside
+        trigger(). Only the orchestrator's own tasks are affected; the running
+        loop's task factory is left alone.
+
+        The task is tracked in _tasks until it finishes, so shutdown() can wait
+        for it.
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            The created task
+        """
+        if self._eager_tasks:
+            task = asyncio.Task(coro, loop=asyncio.get_running_loop(), eager_start=True)
+            if task.done():
+                return task  # Finished inline; nothing to track
+        else:
+            task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
     def _prepare_run(
         self,
         config: CommandConfig,
@@ -493,8 +563,7 @@ class CommandOrchestrator:
         # Register
         self._runtime.add_live_run(result)
         handle = RunHandle(result)
-        async with self._handles_lock:
-            self._handles[result.run_id] = handle
+        await self._register_handle(handle)
 
         # Update latest_run.toml with PENDING state
         self._executor.update_latest_run(result)
@@ -516,13 +585,11 @@ class CommandOrchestrator:
             await self._unregister_handle(result.run_id)
             raise
 
-        # Monitor with context propagation
-        asyncio.create_task(self._monitor_run(result, handle, context))
-
-        # Emit command_started (propagate context)
-        asyncio.create_task(
-            self._emit_auto_trigger(f"command_started:{config.name}", handle, context)
-        )
+        # Monitor with context propagation (emits command_started, then waits for completion).
+        # Each run continues the chain on its own copy: sibling runs started by the same
+        # event must not see each other's lifecycle events as part of their chain.
+        branch = TriggerContext(seen=set(context.seen), history=context.history.copy())
+        self._spawn(self._monitor_run(result, handle, branch))
 
         logger.debug(
             f"Triggered command '{config.name}' from event '{event_name}' (run_id={result.run_id})"
@@ -537,9 +604,10 @@ class CommandOrchestrator:
         context: TriggerContext | None = None,
     ) -> None:
         """
-        Monitor run completion and emit lifecycle events.
+        Emit command_started, monitor run completion, and emit lifecycle events.
 
-        This task waits for the run to complete, then:
+        One task per run covers the whole lifecycle: it first dispatches
+        command_started, then waits for the run to complete, then:
         - Updates runtime state
         - Emits lifecycle triggers (command_success/failed/cancelled)
         - Dispatches lifecycle callbacks
@@ -551,6 +619,11 @@ class CommandOrchestrator:
             context: Optional TriggerContext for cycle prevention
         """
         try:
+            # Emit command_started (with context if available)
+            await self._emit_auto_trigger(
+                _lifecycle_event("command_started", result.command_name), handle, context
+            )
+
             # Wait for completion (event-driven via RunHandle)
             try:
                 await handle.wait()
@@ -570,15 +643,11 @@ class CommandOrchestrator:
                 )
 
             # Determine lifecycle event
-            if result.state == RunState.SUCCESS:
-                event_name = f"command_success:{result.command_name}"
-            elif result.state == RunState.FAILED:
-                event_name = f"command_failed:{result.command_name}"
-            elif result.state == RunState.CANCELLED:
-                event_name = f"command_cancelled:{result.command_name}"
-            else:
+            completion = _COMPLETION_EVENTS.get(result.state)
+            if completion is None:
                 logger.warning(f"Unexpected state {result.state} for {result.run_id}")
                 return
+            event_name = _lifecycle_event(completion[0], result.command_name)
 
             # Emit lifecycle trigger (with context if available)
             await self._emit_auto_trigger(event_name, handle, context)
@@ -682,10 +751,11 @@ class CommandOrchestrator:
 
         for callback, _is_wildcard in callbacks:
             try:
-                if asyncio.iscoroutinefunction(callback):
-                    await callback(handle, context)
-                else:
-                    callback(handle, context)
+                # Await the coroutine an async callback returns instead of introspecting
+                # the callback itself; other return values (incl. Tasks) are left alone
+                result = callback(handle, context)
+                if inspect.iscoroutine(result):
+                    await result
             except Exception as e:
                 # Note: For manual triggers, caller can catch. For auto-triggers,
                 # exceptions are already caught in _emit_auto_trigger
@@ -706,23 +776,17 @@ class CommandOrchestrator:
             state: Final state of run
             handle: RunHandle for context
         """
-        callback_map = {
-            RunState.SUCCESS: "on_success",
-            RunState.FAILED: "on_failed",
-            RunState.CANCELLED: "on_cancelled",
-        }
-
-        callback_type = callback_map.get(state)
-        if not callback_type:
+        completion = _COMPLETION_EVENTS.get(state)
+        if completion is None:
             return
+        callback_type = completion[1]
 
         callback = self._trigger_engine.get_lifecycle_callback(command_name, callback_type)
         if callback:
             try:
-                if asyncio.iscoroutinefunction(callback):
-                    await callback(handle, None)
-                else:
-                    callback(handle, None)
+                result = callback(handle, None)
+                if inspect.iscoroutine(result):
+                    await result
             except Exception as e:
                 logger.exception(
                     f"Lifecycle callback {callback_type} for '{command_name}' failed: {e}"
@@ -747,15 +811,12 @@ class CommandOrchestrator:
         Returns:
             True if run was cancelled, False if not found or already finished
         """
-        # Search for run in all commands
-        for command_name in self._runtime.list_commands():
-            active_runs = self._runtime.get_active_runs(command_name)
-            for run in active_runs:
-                if run.run_id == run_id:
-                    await self._cancel_run_internal(run, comment or "user cancellation")
-                    return True
+        run = self._runtime.find_active_run(run_id)
+        if run is None:
+            return False
 
-        return False
+        await self._cancel_run_internal(run, comment or "user cancellation")
+        return True
 
     async def cancel_command(
         self,
@@ -918,6 +979,18 @@ class CommandOrchestrator:
         self._runtime.verify_registered(name)
         return self._runtime.get_status(name)
 
+    def get_all_statuses(self) -> dict[str, CommandStatus]:
+        """
+        Get status for every registered command at once.
+
+        All statuses are read in one synchronous pass, so no command can change
+        state partway through (unlike calling get_status() per name across awaits).
+
+        Returns:
+            Dict mapping command name to CommandStatus (registration order)
+        """
+        return self._runtime.get_all_statuses()
+
     def get_history(self, name: str, limit: int = 10) -> list[RunResult]:
         """
         Get command execution history.
@@ -1031,6 +1104,26 @@ class CommandOrchestrator:
         """
         return [h for h in self._handles.values() if not h.is_finalized]
 
+    async def wait_until_idle(self, timeout: float | None = None) -> None:
+        """
+        Wait until no runs are in flight.
+
+        A run's handle stays registered until its lifecycle triggers and callbacks
+        have been dispatched, so runs started by those triggers are registered before
+        their parent is released. This makes the method wait for whole trigger chains,
+        not just the runs active at the time of the call.
+
+        Args:
+            timeout: Optional timeout in seconds
+
+        Raises:
+            asyncio.TimeoutError: If timeout expires before the orchestrator is idle
+        """
+        if timeout is not None:
+            await asyncio.wait_for(self._idle_event.wait(), timeout)
+        else:
+            await self._idle_event.wait()
+
     def get_trigger_graph(self) -> dict[str, list[str]]:
         """
         Get a mapping of triggers to the commands they activate.
@@ -1047,19 +1140,7 @@ class CommandOrchestrator:
                 "deploy": ["Deploy"],
             }
         """
-        trigger_map: dict[str, list[str]] = {}
-
-        for cmd_name in self._runtime.list_commands():
-            config = self._runtime.get_command(cmd_name)
-            if config is None:
-                continue
-
-            for trigger in config.triggers:
-                if trigger not in trigger_map:
-                    trigger_map[trigger] = []
-                trigger_map[trigger].append(cmd_name)
-
-        return trigger_map
+        return self._trigger_engine.get_trigger_map("triggers")
 
     async def _register_handle(self, handle: RunHandle) -> None:
         """
@@ -1070,6 +1151,7 @@ class CommandOrchestrator:
         """
         async with self._handles_lock:
             self._handles[handle.run_id] = handle
+            self._idle_event.clear()
 
     async def _unregister_handle(self, run_id: str) -> None:
         """
@@ -1084,6 +1166,8 @@ class CommandOrchestrator:
             handle = self._handles.pop(run_id, None)
             if handle:
                 await handle.cleanup()
+            if not self._handles:
+                self._idle_event.set()
 
     # ========================================================================
     # Callbacks
@@ -1129,6 +1213,35 @@ class CommandOrchestrator:
             logger.debug(f"Unregistered callback for event pattern '{event_pattern}'")
         return success
 
+    # Typed lifecycle hooks for every command. Each is shorthand for
+    # on_event("command_<type>:*", callback); the TriggerEngine keys "type:*"
+    # patterns by event type, so dispatch is a dict lookup with no pattern scan.
+    # Remove with off_event("command_<type>:*", callback).
+
+    def on_command_started(
+        self, callback: Callable[[RunHandle | None, Any], Awaitable[None] | None]
+    ) -> None:
+        """Register callback for command_started of any command."""
+        self.on_event("command_started:*", callback)
+
+    def on_command_success(
+        self, callback: Callable[[RunHandle | None, Any], Awaitable[None] | None]
+    ) -> None:
+        """Register callback for command_success of any command."""
+        self.on_event("command_success:*", callback)
+
+    def on_command_failed(
+        self, callback: Callable[[RunHandle | None, Any], Awaitable[None] | None]
+    ) -> None:
+        """Register callback for command_failed of any command."""
+        self.on_event("command_failed:*", callback)
+
+    def on_command_cancelled(
+        self, callback: Callable[[RunHandle | None, Any], Awaitable[None] | None]
+    ) -> None:
+        """Register callback for command_cancelled of any command."""
+        self.on_event("command_cancelled:*", callback)
+
     def set_lifecycle_callback(
         self,
         name: str,
@@ -1233,8 +1346,10 @@ class CommandOrchestrator:
         1. Set _is_shutdown flag
         2. Optionally cancel all active runs
         3. Wait for completion with timeout using asyncio.gather
-        4. Cleanup executor
-        5. Cleanup all handles
+        4. Join background tasks (run monitors finishing lifecycle triggers and
+           callbacks); tasks still pending when the timeout expires are cancelled
+        5. Cleanup executor
+        6. Cleanup all handles
 
         Args:
             timeout: Max time to wait for completion (seconds)
@@ -1300,6 +1415,10 @@ class CommandOrchestrator:
         if cancel_running:
             cancelled_count = await self.cancel_all("orchestrator shutdown")
 
+        # Runs and background tasks share one timeout budget
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+
         # Wait for all active handles with timeout using asyncio.gather
         active_handles = self.get_all_active_handles()
         if active_handles:
@@ -1323,6 +1442,18 @@ class CommandOrchestrator:
         else:
             timeout_expired = False
 
+        # Join background tasks so no monitor or auto-trigger outlives shutdown.
+        # The calling task is skipped (shutdown() may be called from a callback).
+        current = asyncio.current_task()
+        tasks = [t for t in self._tasks if t is not current]
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=max(0.0, deadline - loop.time()))
+            if pending:
+                logger.debug(f"Cancelling {len(pending)} background task(s) still running")
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+
         # Cleanup executor
         await self._executor.cleanup()
 
@@ -1331,6 +1462,7 @@ class CommandOrchestrator:
             for handle in list(self._handles.values()):
                 await handle.cleanup()
             self._handles.clear()
+            self._idle_event.set()
 
         logger.info(
             f"Orchestrator shutdown complete: "
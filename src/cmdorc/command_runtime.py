@@ -21,6 +21,7 @@ from __future__ import annotations
 import datetime
 import logging
 from collections import defaultdict, deque
+from itertools import islice
 
 from .command_config import CommandConfig
 from .exceptions import CommandNotFoundError
@@ -43,8 +44,14 @@ class CommandRuntime:
         # Configuration registry: name -> CommandConfig
         self._configs: dict[str, CommandConfig] = {}
 
-        # Active runs: name -> list of currently running RunResults
-        self._active_runs: dict[str, list[RunResult]] = defaultdict(list)
+        # Bumped on every register/remove/update so derived indexes
+        # (e.g. TriggerEngine's trigger lookup) know when to rebuild
+        self._config_version = 0
+
+        # Active runs: name -> {run_id: RunResult} of currently running runs
+        # (insertion-ordered; keyed so completion removes by run_id, not by a
+        # field-by-field dataclass comparison against every active run)
+        self._active_runs: dict[str, dict[str, RunResult]] = defaultdict(dict)
 
         # Latest result: name -> most recent completed RunResult
         # Always present after first run, even if keep_in_memory=0
@@ -77,6 +84,7 @@ class CommandRuntime:
             raise ValueError(f"Command '{config.name}' already registered")
 
         self._configs[config.name] = config
+        self._config_version += 1
 
         # Initialize history deque with appropriate maxlen
         if config.keep_in_memory > 0:
@@ -101,6 +109,7 @@ class CommandRuntime:
 
         # Clean up all state
         del self._configs[name]
+        self._config_version += 1
         self._active_runs.pop(name, None)
         self._latest_result.pop(name, None)
         self._history.pop(name, None)
@@ -123,6 +132,7 @@ class CommandRuntime:
 
         old_config = self._configs[config.name]
         self._configs[config.name] = config
+        self._config_version += 1
 
         # Adjust history deque if keep_in_memory changed
         if config.keep_in_memory != old_config.keep_in_memory:
@@ -168,6 +178,11 @@ class CommandRuntime:
         """Return list of all registered command names."""
         return list(self._configs.keys())
 
+    @property
+    def config_version(self) -> int:
+        """Counter that changes whenever a command is registered, removed, or updated."""
+        return self._config_version
+
     # ================================================================
     # Active Run Tracking
     # ================================================================
@@ -183,7 +198,7 @@ class CommandRuntime:
         if name not in self._configs:
             raise CommandNotFoundError(f"Command '{name}' not registered")
 
-        self._active_runs[name].append(result)
+        self._active_runs[name][result.run_id] = result
 
         # Record start time for debounce (prevent rapid successive starts)
         self._last_start[name] = datetime.datetime.now()
@@ -220,13 +235,12 @@ class CommandRuntime:
         self.verify_registered(name)
 
         # Remove from active runs
-        active = self._active_runs.get(name, [])
-        try:
-            active.remove(result)
+        active = self._active_runs.get(name, {})
+        if active.pop(result.run_id, None) is not None:
             logger.debug(
                 f"Removed run {result.run_id[:8]} from active '{name}' (remaining={len(active)})"
             )
-        except ValueError:
+        else:
             logger.warning(f"Run {result.run_id[:8]} for '{name}' was not in active list")
 
         # Update latest result (always, even if keep_in_memory=0)
@@ -284,7 +298,23 @@ class CommandRuntime:
             KeyError if command not registered
         """
         self.verify_registered(name)
-        return self._active_runs.get(name, []).copy()
+        active = self._active_runs.get(name)
+        return list(active.values()) if active else []
+
+    def find_active_run(self, run_id: str) -> RunResult | None:
+        """
+        Find an active run by run_id across all commands.
+
+        One dict lookup per command rather than a scan of every active run.
+
+        Returns:
+            The active RunResult, or None if no active run has this run_id
+        """
+        for active in self._active_runs.values():
+            result = active.get(run_id)
+            if result is not None:
+                return result
+        return None
 
     # ================================================================
     # History & Latest Result
@@ -337,18 +367,11 @@ class CommandRuntime:
         if history is None:
             return []
 
-        # Get the most recent runs and reverse to put most recent first
-        # deque is ordered by completion time (oldest first internally)
+        # deque is ordered by completion time (oldest first internally); walk it
+        # newest-first so only the returned runs are copied, not the whole history
         if limit > 0:
-            # Get last N items and reverse them
-            recent = list(history)[-limit:]
-            recent.reverse()
-            return recent
-        else:
-            # Get all items and reverse them
-            all_history = list(history)
-            all_history.reverse()
-            return all_history
+            return list(islice(reversed(history), limit))
+        return list(reversed(history))
 
     def add_to_history(self, command_name: str, result: RunResult) -> None:
         """
@@ -394,8 +417,20 @@ class CommandRuntime:
             KeyError if command not registered
         """
         self.verify_registered(name)
+        return self._build_status(name)
+
+    def get_all_statuses(self) -> dict[str, CommandStatus]:
+        """
+        Get status objects for every registered command in one pass.
+
+        Returns:
+            Dict mapping command name to CommandStatus (registration order)
+        """
+        return {name: self._build_status(name) for name in self._configs}
 
-        active_count = len(self._active_runs.get(name, []))
+    def _build_status(self, name: str) -> CommandStatus:
+        """Build the CommandStatus for a registered command."""
+        active_count = len(self._active_runs.get(name, ()))
         last_run = self._latest_result.get(name)
 
         # Determine state string
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from io import TextIOBase
 from pathlib import Path
 from typing import Any, BinaryIO, TextIO
 
@@ -9,7 +10,12 @@ try:
 except ImportError:
     import tomli  # <3.11
 
-from .command_config import CommandConfig, OutputStorageConfig, RunnerConfig
+from .command_config import (
+    DEFAULT_OUTPUT_STORAGE,
+    CommandConfig,
+    OutputStorageConfig,
+    RunnerConfig,
+)
 from .exceptions import ConfigValidationError
 
 logger = logging.getLogger(__name__)
@@ -22,8 +28,10 @@ def _read_toml(path: str | Path | BinaryIO | TextIO) -> tuple[Path | None, dict]
     """
     Read TOML file and return (config_path, data).
 
+    Files are parsed straight from bytes (no decode/re-encode round trip).
+
     Args:
-        path: File path or file-like object
+        path: File path or file-like object (binary or text mode)
 
     Returns:
         Tuple of (config_path, parsed_data)
@@ -34,6 +42,9 @@ def _read_toml(path: str | Path | BinaryIO | TextIO) -> tuple[Path | None, dict]
         config_path = Path(path).resolve()
         with open(config_path, "rb") as f:
             data = tomli.load(f)
+    elif isinstance(path, TextIOBase):
+        # tomllib.load() only accepts binary streams; text is already decoded
+        data = tomli.loads(path.read())
     else:
         data = tomli.load(path)  # type: ignore
     return config_path, data
@@ -153,7 +164,7 @@ def load_configs(paths: list[str | Path | BinaryIO | TextIO]) -> RunnerConfig:
     # Build OutputStorageConfig from merged values
     try:
         output_storage = (
-            OutputStorageConfig(**merged_output) if merged_output else OutputStorageConfig()
+            OutputStorageConfig(**merged_output) if merged_output else DEFAULT_OUTPUT_STORAGE
         )
     except (TypeError, ValueError) as e:
         raise ConfigValidationError(f"Invalid config in [output_storage]: {e}") from None
@@ -7,6 +7,7 @@ Executes commands as local subprocesses with:
 - Timeout handling
 - Graceful cancellation (SIGTERM → SIGKILL)
 - Background monitoring tasks
+- Shell-free exec for simple commands (no shell metacharacters)
 """
 
 from __future__ import annotations
@@ -14,14 +15,40 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+import re
+import shlex
 from pathlib import Path
 
-from .command_config import OutputStorageConfig
+from .command_config import DEFAULT_OUTPUT_STORAGE, OutputStorageConfig
 from .command_executor import CommandExecutor
 from .run_result import ResolvedCommand, RunResult
 
 logger = logging.getLogger(__name__)
 
+# Anything the shell would interpret (operators, redirects, expansions, globs,
+# escapes, comments, line breaks). Quotes are allowed: shlex splits them the
+# same way sh does once $, ` and \ are ruled out.
+_SHELL_META = re.compile(r"[;&|<>()$`\\*?\[\]{}~#!\n\r]")
+
+
+def _shell_free_argv(command: str) -> list[str] | None:
+    """
+    Split a command into argv if it can run without a shell.
+
+    Returns None when the command needs /bin/sh (metacharacters, unbalanced
+    quotes, a leading VAR=value assignment, empty command) or on Windows,
+    where the shell path is always used.
+    """
+    if os.name == "nt" or _SHELL_META.search(command):
+        return None
+    try:
+        argv = shlex.split(command)
+    except ValueError:
+        return None
+    if not argv or "=" in argv[0]:
+        return None
+    return argv
+
 
 class LocalSubprocessExecutor(CommandExecutor):
     """
@@ -32,11 +59,15 @@ class LocalSubprocessExecutor(CommandExecutor):
     - Output capture (stdout + stderr merged)
     - Timeout enforcement
     - Graceful cancellation (SIGTERM, then SIGKILL after grace period)
+    - Optional cap on concurrently running subprocesses
     - Automatic cleanup on shutdown
     """
 
     def __init__(
-        self, cancel_grace_period: float = 3.0, output_storage: OutputStorageConfig | None = None
+        self,
+        cancel_grace_period: float = 3.0,
+        output_storage: OutputStorageConfig | None = None,
+        max_processes: int | None = None,
     ):
         """
         Initialize the executor.
@@ -44,7 +75,14 @@ class LocalSubprocessExecutor(CommandExecutor):
         Args:
             cancel_grace_period: Seconds to wait for SIGTERM before SIGKILL
             output_storage: Optional output storage configuration
+            max_processes: Maximum subprocesses running at once across all commands
+                (None = unlimited). Runs beyond the limit stay PENDING until a slot frees.
+
+        Raises:
+            ValueError: If max_processes is less than 1
         """
+        if max_processes is not None and max_processes < 1:
+            raise ValueError("max_processes must be >= 1 or None")
         # Active processes: run_id -> subprocess.Process
         self._processes: dict[str, asyncio.subprocess.Process] = {}
 
@@ -55,11 +93,15 @@ class LocalSubprocessExecutor(CommandExecutor):
         self._cancel_grace_period = cancel_grace_period
 
         # Output storage configuration
-        self._output_storage = output_storage or OutputStorageConfig()
+        self._output_storage = output_storage or DEFAULT_OUTPUT_STORAGE
+
+        # Process slots: bounds subprocess fan-out when a trigger starts many runs
+        self._process_slots = asyncio.Semaphore(max_processes) if max_processes else None
 
         logger.debug(
             f"Initialized LocalSubprocessExecutor ("
             f"cancel_grace_period={cancel_grace_period}s, "
+            f"max_processes={max_processes}, "
             f"output_storage_enabled={self._output_storage.is_enabled})"
         )
 
@@ -104,20 +146,18 @@ class LocalSubprocessExecutor(CommandExecutor):
         """
         run_id = result.run_id
         process = None
+        slot_held = False
 
         try:
+            # Wait for a free process slot (run stays PENDING meanwhile)
+            if self._process_slots is not None:
+                await self._process_slots.acquire()
+                slot_held = True
+
             # Launch subprocess
             logger.debug(f"Launching subprocess for run {run_id[:8]}")
 
-            process = await asyncio.create_subprocess_shell(
-                resolved.command,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.STDOUT,  # Merge stderr into stdout
-                cwd=resolved.cwd,
-                env=resolved.env,
-                # Start in new process group for better signal handling
-                preexec_fn=os.setpgrp if os.name != "nt" else None,
-            )
+            process = await self._spawn(resolved)
 
             # Store process reference
             self._processes[run_id] = process
@@ -128,24 +168,22 @@ class LocalSubprocessExecutor(CommandExecutor):
             # Update latest_run.toml to reflect RUNNING state
             self.update_latest_run(result)
 
-            # Wait for completion (with optional timeout)
+            # Wait for completion: one communicate() drains the pipe and waits for
+            # exit; wait_for() with a None timeout simply awaits it
             if resolved.timeout_secs:
                 logger.debug(f"Run {run_id[:8]} has timeout of {resolved.timeout_secs}s")
-                try:
-                    stdout, _ = await asyncio.wait_for(
-                        process.communicate(),
-                        timeout=resolved.timeout_secs,
-                    )
-                except asyncio.TimeoutError:
-                    logger.warning(f"Run {run_id[:8]} timed out after {resolved.timeout_secs}s")
-                    # Mark as failed FIRST (before killing, which might get cancelled)
-                    result.mark_failed(f"Command timed out after {resolved.timeout_secs} seconds")
-                    # Kill the process
-                    await self._kill_process(process)
-                    return
-            else:
-                # No timeout
-                stdout, _ = await process.communicate()
+            try:
+                stdout, _ = await asyncio.wait_for(
+                    process.communicate(),
+                    timeout=resolved.timeout_secs or None,
+                )
+            except asyncio.TimeoutError:
+                logger.warning(f"Run {run_id[:8]} timed out after {resolved.timeout_secs}s")
+                # Mark as failed FIRST (before killing, which might get cancelled)
+                result.mark_failed(f"Command timed out after {resolved.timeout_secs} seconds")
+                # Kill the process
+                await self._kill_process(process)
+                return
 
             # Capture output
             output = stdout.decode("utf-8", errors="replace") if stdout else ""
@@ -202,11 +240,41 @@ class LocalSubprocessExecutor(CommandExecutor):
             result.mark_failed(e)
 
         finally:
+            if slot_held:
+                self._process_slots.release()
+
             # Clean up internal state
             self._processes.pop(run_id, None)
             self._tasks.pop(run_id, None)
             logger.debug(f"Cleaned up internal state for run {run_id[:8]}")
 
+    async def _spawn(self, resolved: ResolvedCommand) -> asyncio.subprocess.Process:
+        """
+        Start the subprocess for a resolved command.
+
+        Simple commands (see _shell_free_argv) are exec'd directly, saving the
+        /bin/sh fork+exec. If that fails (shell builtins like `exit` or `cd`,
+        missing executables), the command goes through the shell so the exit
+        code and error output match what the shell would produce.
+        """
+        kwargs = {
+            "stdout": asyncio.subprocess.PIPE,
+            "stderr": asyncio.subprocess.STDOUT,  # Merge stderr into stdout
+            "cwd": resolved.cwd,
+            "env": resolved.env,
+            # Start in new process group for better signal handling
+            "preexec_fn": os.setpgrp if os.name != "nt" else None,
+        }
+
+        argv = _shell_free_argv(resolved.command)
+        if argv is not None:
+            try:
+                return await asyncio.create_subprocess_exec(*argv, **kwargs)
+            except OSError as e:
+                logger.debug(f"Direct exec of {argv[0]!r} failed ({e}), falling back to shell")
+
+        return await asyncio.create_subprocess_shell(resolved.command, **kwargs)
+
     async def cancel_run(
         self,
         result: RunResult,
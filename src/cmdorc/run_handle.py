@@ -156,6 +156,11 @@ class RunHandle:
         """Unique identifier for this run."""
         return self._result.run_id
 
+    @property
+    def short_id(self) -> str:
+        """First 8 characters of run_id, for display (sliced on access)."""
+        return self._result.run_id[:8]
+
     @property
     def state(self) -> RunState:
         """Current state of the run (PENDING, RUNNING, SUCCESS, FAILED, CANCELLED)."""
@@ -3,6 +3,8 @@ from __future__ import annotations
 
 import datetime
 import logging
+import time
+import uuid
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum
@@ -67,7 +69,7 @@ class RunResult:
     command_name: str
     """Name of the command being executed."""
 
-    run_id: str = field(default_factory=lambda: str(__import__("uuid").uuid4()))
+    run_id: str = field(default_factory=lambda: uuid.uuid4().hex)
     """Unique identifier for this run."""
 
     trigger_event: str | None = None
@@ -138,6 +140,9 @@ class RunResult:
     _is_finalized: bool = field(init=False, default=False)
     """Internal flag set by _finalize()."""
 
+    _start_ns: int | None = field(init=False, default=None, repr=False, compare=False)
+    """time.monotonic_ns() at mark_running(), so duration is immune to wall-clock jumps."""
+
     # ------------------------------------------------------------------ #
     # State transitions
     # ------------------------------------------------------------------ #
@@ -145,6 +150,7 @@ class RunResult:
         """Transition to RUNNING and record start time."""
         self.state = RunState.RUNNING
         self.start_time = datetime.datetime.now()
+        self._start_ns = time.monotonic_ns()
         if comment is not None:
             self.comment = comment
         logger.debug(f"Run {self.run_id[:8]} ('{self.command_name}') started")
@@ -188,7 +194,12 @@ class RunResult:
         self._is_finalized = True
 
         self.end_time = datetime.datetime.now()
-        if self.start_time:
+        if self._start_ns is not None:
+            # Measured on the monotonic clock (NTP/DST adjustments can't skew it), in
+            # integer nanoseconds truncated to timedelta's microsecond resolution
+            elapsed_us = (time.monotonic_ns() - self._start_ns) // 1000
+            self.duration = datetime.timedelta(microseconds=elapsed_us)
+        elif self.start_time:
             self.duration = self.end_time - self.start_time
         else:
             self.duration = datetime.timedelta(0)
@@ -261,7 +272,7 @@ class RunResult:
 
         Example output:
             command_name = "Tests"
-            run_id = "123e4567-e89b-12d3-a456-426614174000"
+            run_id = "123e4567e89b12d3a456426614174000"
             state = "SUCCESS"
             duration_str = "2.3s"
             start_time = "2025-12-25T10:30:00"
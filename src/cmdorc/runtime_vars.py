@@ -25,6 +25,7 @@ from __future__ import annotations
 import logging
 import os
 import re
+from functools import lru_cache
 
 from .command_config import CommandConfig
 from .exceptions import VariableResolutionError
@@ -38,13 +39,24 @@ VAR_PATTERN = re.compile(r"\{\{\s*([\w_]+)\s*\}\}")
 # Pattern for $VAR_NAME environment variable syntax (uppercase only)
 ENV_VAR_PATTERN = re.compile(r"\$([A-Z_][A-Z0-9_]*)")
 
+# Resolved templates: (template, max_depth) -> (names looked up, their values, result).
+# A hit requires every looked-up variable to still have the same value.
+_resolve_cache: dict[tuple[str, int], tuple[tuple[str, ...], tuple[str, ...], str]] = {}
+_RESOLVE_CACHE_SIZE = 512
+
 
 # =====================================================================
 #   Variable Resolution Helpers
 # =====================================================================
 
 
-def resolve_double_brace_vars(value: str, vars_dict: dict[str, str], *, max_depth: int = 10) -> str:
+def resolve_double_brace_vars(
+    value: str,
+    vars_dict: dict[str, str],
+    *,
+    max_depth: int = 10,
+    used: dict[str, None] | None = None,
+) -> str:
     """
     Resolve {{ var }} occurrences using vars_dict.
     Only replaces double-braced variables, not single-brace placeholders.
@@ -54,6 +66,7 @@ def resolve_double_brace_vars(value: str, vars_dict: dict[str, str], *, max_dept
         value: String containing {{ variable_name }} references
         vars_dict: Dictionary mapping variable names to values
         max_depth: Maximum nesting depth to prevent infinite loops (default 10)
+        used: Optional dict that collects (as keys) every variable name looked up
 
     Returns:
         String with all {{ }} references resolved
@@ -61,6 +74,8 @@ def resolve_double_brace_vars(value: str, vars_dict: dict[str, str], *, max_dept
     Raises:
         ValueError: If a variable is missing or nested resolution never stabilizes
     """
+    if "{{" not in value:
+        return value  # Nothing to resolve (common for plain commands)
 
     for _ in range(max_depth):
         changed = False
@@ -72,6 +87,8 @@ def resolve_double_brace_vars(value: str, vars_dict: dict[str, str], *, max_dept
             if var_name not in vars_dict:
                 raise VariableResolutionError(f"Missing variable: '{var_name}'")
 
+            if used is not None:
+                used[var_name] = None
             changed = True
             return vars_dict[var_name]
 
@@ -85,7 +102,7 @@ def resolve_double_brace_vars(value: str, vars_dict: dict[str, str], *, max_dept
     # If still unresolved, we hit a cycle or unresolvable nested structure
     if VAR_PATTERN.search(value):
         # Extract unresolved variable names to help with debugging
-        unresolved_vars = re.findall(r"\{\{\s*(\w+)\s*\}\}", value)
+        unresolved_vars = VAR_PATTERN.findall(value)
         raise VariableResolutionError(
             f"Failed to resolve variables after {max_depth} passes. "
             f"Remaining unresolved variables in '{value}': {unresolved_vars}. "
@@ -141,6 +158,7 @@ def merge_vars(
     return merged
 
 
+@lru_cache(maxsize=512)
 def _preprocess_env_vars(template_str: str) -> str:
     """
     Convert $VAR_NAME syntax to {{ VAR_NAME }} for uniform resolution.
@@ -148,6 +166,9 @@ def _preprocess_env_vars(template_str: str) -> str:
     This allows users to write $HOME instead of {{ HOME }} in configs.
     Only converts uppercase identifiers starting with $ (prevents $$shell escaping).
 
+    Cached per template string: the same command and env templates are
+    resolved on every run, and the conversion depends only on the template.
+
     Args:
         template_str: String that may contain $VAR_NAME references
 
@@ -191,14 +212,32 @@ def resolve_runtime_vars(
     """
     # First, convert $VAR_NAME to {{ VAR_NAME }} for uniform handling
     processed = _preprocess_env_vars(template_str)
+    if "{{" not in processed:
+        return processed
+
+    # The result depends only on the variables looked up while resolving (including
+    # nested ones), so reuse it while those values are unchanged
+    key = (processed, max_depth)
+    cached = _resolve_cache.get(key)
+    if cached is not None:
+        names, values, result = cached
+        if tuple(merged_vars.get(name) for name in names) == values:
+            return result
 
     # Then resolve using local resolve_double_brace_vars function
+    used: dict[str, None] = {}
     try:
-        return resolve_double_brace_vars(processed, merged_vars, max_depth=max_depth)
+        result = resolve_double_brace_vars(processed, merged_vars, max_depth=max_depth, used=used)
     except VariableResolutionError as e:
         # Enrich error with context
         raise VariableResolutionError(f"In template '{template_str}': {e}") from e
 
+    if len(_resolve_cache) >= _RESOLVE_CACHE_SIZE:
+        _resolve_cache.clear()
+    names = tuple(used)
+    _resolve_cache[key] = (names, tuple(merged_vars[name] for name in names), result)
+    return result
+
 
 def prepare_resolved_command(
     config: CommandConfig,
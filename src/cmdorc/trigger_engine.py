@@ -20,7 +20,8 @@ from __future__ import annotations
 
 import re
 from collections import defaultdict
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -31,6 +32,24 @@ if TYPE_CHECKING:
     from .types import TriggerContext
 
 
+@lru_cache(maxsize=256)
+def _wildcard_regex(pattern: str) -> re.Pattern[str]:
+    """Compile a * wildcard pattern to a regex (cached per pattern)."""
+    return re.compile(re.escape(pattern).replace(r"\*", ".*"))
+
+
+def _event_type_key(pattern: str) -> str | None:
+    """Return the event type of a "type:*" wildcard pattern.
+
+    Returns None for any other wildcard shape (e.g. "command_*", "*:Tests").
+    """
+    if pattern.endswith(":*"):
+        event_type = pattern[:-2]
+        if event_type and "*" not in event_type and ":" not in event_type:
+            return event_type
+    return None
+
+
 class TriggerEngine:
     """Event routing and callback dispatch engine.
 
@@ -51,6 +70,22 @@ class TriggerEngine:
         self._wildcard_callbacks: list[tuple[str, Callable]] = []
         self._lifecycle_callbacks: dict[str, dict[str, Callable]] = {}
 
+        # Dispatch index over _wildcard_callbacks. "type:*" patterns (the common
+        # "command_success:*" form) are keyed by event type for a dict lookup;
+        # other wildcard patterns keep a precompiled regex and are scanned.
+        # Entries carry a registration sequence number to preserve dispatch order.
+        self._event_type_callbacks: dict[str, list[tuple[int, Callable]]] = defaultdict(list)
+        self._pattern_callbacks: list[tuple[int, re.Pattern[str], Callable]] = []
+        self._wildcard_seq = 0
+
+        # Command lookup per trigger type, rebuilt when runtime.config_version changes:
+        # trigger_type -> (config_version, exact trigger -> configs, wildcard (trigger, config) pairs)
+        # Config tuples are immutable, so get_matching_commands() can hand them out uncopied.
+        self._command_index: dict[
+            str,
+            tuple[int, dict[str, tuple[CommandConfig, ...]], list[tuple[str, CommandConfig]]],
+        ] = {}
+
     # ========================================================================
     # Pattern Matching
     # ========================================================================
@@ -78,10 +113,8 @@ class TriggerEngine:
         if "*" not in pattern:
             return False
 
-        # Convert wildcard pattern to regex
-        # Escape special regex chars except *, then convert * to .*
-        regex_pattern = re.escape(pattern).replace(r"\*", ".*")
-        return re.fullmatch(regex_pattern, event_name) is not None
+        # Wildcard pattern as regex: special chars escaped, * converted to .*
+        return _wildcard_regex(pattern).fullmatch(event_name) is not None
 
     # ========================================================================
     # Command Matching
@@ -91,7 +124,7 @@ class TriggerEngine:
         self,
         event_name: str,
         trigger_type: Literal["triggers", "cancel_on_triggers"],
-    ) -> list[CommandConfig]:
+    ) -> Sequence[CommandConfig]:
         """Return commands that match this event for the given trigger type.
 
         Returns exact matches first, then wildcard matches, to ensure
@@ -102,29 +135,76 @@ class TriggerEngine:
             trigger_type: "triggers" or "cancel_on_triggers"
 
         Returns:
-            List of CommandConfig objects that match (exact first, then wildcards)
+            Tuple of CommandConfig objects that match (exact first, then wildcards)
         """
-        exact_matches = []
+        exact_index, wildcard_triggers = self._get_command_index(trigger_type)
+
+        exact_matches = exact_index.get(event_name, ())
+        if not wildcard_triggers:
+            return exact_matches
+
         wildcard_matches = []
+        for trigger, cmd_config in wildcard_triggers:
+            if (
+                cmd_config not in exact_matches
+                and cmd_config not in wildcard_matches
+                and self.matches(trigger, event_name)
+            ):
+                wildcard_matches.append(cmd_config)
+
+        return exact_matches + tuple(wildcard_matches)
 
+    def get_trigger_map(
+        self, trigger_type: Literal["triggers", "cancel_on_triggers"] = "triggers"
+    ) -> dict[str, list[str]]:
+        """Return a mapping of each trigger string to the commands it matches.
+
+        Built from the cached command index, so it costs one pass over the
+        triggers rather than over every command's trigger list.
+
+        Args:
+            trigger_type: "triggers" or "cancel_on_triggers"
+
+        Returns:
+            Dict mapping trigger strings to command names (registration order)
+        """
+        exact_index, wildcard_triggers = self._get_command_index(trigger_type)
+        trigger_map = {
+            trigger: [cmd_config.name for cmd_config in configs]
+            for trigger, configs in exact_index.items()
+        }
+        for trigger, cmd_config in wildcard_triggers:
+            trigger_map.setdefault(trigger, []).append(cmd_config.name)
+        return trigger_map
+
+    def _get_command_index(
+        self, trigger_type: Literal["triggers", "cancel_on_triggers"]
+    ) -> tuple[dict[str, tuple[CommandConfig, ...]], list[tuple[str, CommandConfig]]]:
+        """Return the trigger -> commands index, rebuilding it if configs changed.
+
+        Commands keep registration order within each trigger, and a command is
+        listed once per trigger even if the trigger appears twice in its config.
+        """
+        version = self._runtime.config_version
+        cached = self._command_index.get(trigger_type)
+        if cached is not None and cached[0] == version:
+            return cached[1], cached[2]
+
+        exact_lists: dict[str, list[CommandConfig]] = {}
+        wildcard_triggers: list[tuple[str, CommandConfig]] = []
         for command_name in self._runtime.list_commands():
             cmd_config = self._runtime.get_command(command_name)
             if not cmd_config:
                 continue
+            for trigger in dict.fromkeys(getattr(cmd_config, trigger_type, [])):
+                if "*" in trigger:
+                    wildcard_triggers.append((trigger, cmd_config))
+                else:
+                    exact_lists.setdefault(trigger, []).append(cmd_config)
 
-            # Get the trigger list for this trigger type
-            trigger_list = getattr(cmd_config, trigger_type, [])
-
-            # Check for match
-            for trigger in trigger_list:
-                if trigger == event_name:
-                    exact_matches.append(cmd_config)
-                    break
-                elif self.matches(trigger, event_name):
-                    wildcard_matches.append(cmd_config)
-                    break
-
-        return exact_matches + wildcard_matches
+        exact_index = {trigger: tuple(configs) for trigger, configs in exact_lists.items()}
+        self._command_index[trigger_type] = (version, exact_index, wildcard_triggers)
+        return exact_index, wildcard_triggers
 
     # ========================================================================
     # Callback Matching
@@ -143,19 +223,57 @@ class TriggerEngine:
         Returns:
             List of (callback, is_wildcard) tuples in dispatch order
         """
-        result = []
-
         # Exact matches (in registration order)
-        for callback in self._exact_callbacks.get(event_name, []):
-            result.append((callback, False))
-
-        # Wildcard matches (in registration order)
-        for pattern, callback in self._wildcard_callbacks:
-            if self.matches(pattern, event_name):
-                result.append((callback, True))
+        result = [(callback, False) for callback in self._exact_callbacks.get(event_name, ())]
+
+        if not self._wildcard_callbacks:
+            return result
+
+        # Wildcard matches: "type:*" patterns by dict lookup, the rest by regex
+        event_type, sep, _ = event_name.partition(":")
+        keyed = self._event_type_callbacks.get(event_type, ()) if sep else ()
+        scanned = [
+            (seq, callback)
+            for seq, regex, callback in self._pattern_callbacks
+            if regex.fullmatch(event_name)
+        ]
+        if keyed and scanned:
+            # Merge both groups back into registration order
+            matched = sorted([*keyed, *scanned], key=lambda entry: entry[0])
+        else:
+            matched = keyed or scanned
 
+        result.extend((callback, True) for _, callback in matched)
         return result
 
+    def has_subscribers(self, event_name: str) -> bool:
+        """Check whether any command or callback could react to this event.
+
+        A few dict probes, with no list building, so trigger() can skip
+        matching and dispatch for events nobody listens to. May return True for
+        an event that a non-"type:*" wildcard pattern turns out not to match,
+        but never returns False for an event that has a subscriber.
+
+        Args:
+            event_name: Event to check
+
+        Returns:
+            True if the event may have matching commands or callbacks
+        """
+        if self._exact_callbacks.get(event_name) or self._pattern_callbacks:
+            return True
+
+        event_type, sep, _ = event_name.partition(":")
+        if sep and self._event_type_callbacks.get(event_type):
+            return True
+
+        for trigger_type in ("triggers", "cancel_on_triggers"):
+            exact_index, wildcard_triggers = self._get_command_index(trigger_type)
+            if event_name in exact_index or wildcard_triggers:
+                return True
+
+        return False
+
     # ========================================================================
     # Callback Registration
     # ========================================================================
@@ -177,6 +295,13 @@ class TriggerEngine:
 
         if "*" in pattern:
             self._wildcard_callbacks.append((pattern, callback))
+            seq = self._wildcard_seq
+            self._wildcard_seq += 1
+            event_type = _event_type_key(pattern)
+            if event_type is not None:
+                self._event_type_callbacks[event_type].append((seq, callback))
+            else:
+                self._pattern_callbacks.append((seq, _wildcard_regex(pattern), callback))
         else:
             self._exact_callbacks[pattern].append(callback)
 
@@ -196,15 +321,34 @@ class TriggerEngine:
             self._wildcard_callbacks = [
                 (p, c) for p, c in self._wildcard_callbacks if not (p == pattern and c == callback)
             ]
-            return len(self._wildcard_callbacks) < original_length
+            if len(self._wildcard_callbacks) == original_length:
+                return False
+
+            # Drop the same registrations from the dispatch index
+            event_type = _event_type_key(pattern)
+            if event_type is not None:
+                entries = self._event_type_callbacks[event_type]
+                entries[:] = [(seq, c) for seq, c in entries if c != callback]
+                if not entries:
+                    del self._event_type_callbacks[event_type]
+            else:
+                regex = _wildcard_regex(pattern)
+                self._pattern_callbacks = [
+                    (seq, r, c)
+                    for seq, r, c in self._pattern_callbacks
+                    if not (r == regex and c == callback)
+                ]
+            return True
         else:
             # Exact callback
             if pattern in self._exact_callbacks:
                 try:
                     self._exact_callbacks[pattern].remove(callback)
-                    return True
                 except ValueError:
                     return False
+                if not self._exact_callbacks[pattern]:
+                    del self._exact_callbacks[pattern]
+                return True
         return False
 
     def set_lifecycle_callback(
@@ -293,6 +437,8 @@ class TriggerEngine:
         """
         self._exact_callbacks.clear()
         self._wildcard_callbacks.clear()
+        self._event_type_callbacks.clear()
+        self._pattern_callbacks.clear()
         self._lifecycle_callbacks.clear()
 
     def __repr__(self) -> str:
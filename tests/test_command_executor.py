@@ -11,7 +11,7 @@ import sys
 import pytest
 
 from cmdorc.command_executor import CommandExecutor
-from cmdorc.local_subprocess_executor import LocalSubprocessExecutor
+from cmdorc.local_subprocess_executor import LocalSubprocessExecutor, _shell_free_argv
 from cmdorc.mock_executor import MockExecutor
 from cmdorc.run_result import ResolvedCommand, RunResult, RunState
 
@@ -337,6 +337,37 @@ async def test_local_executor_concurrent_runs(local_executor):
         assert f"Run {i}" in result.output
 
 
+@pytest.mark.asyncio
+async def test_local_executor_max_processes_queues_runs():
+    """Runs beyond max_processes stay PENDING until a process slot frees."""
+    executor = LocalSubprocessExecutor(max_processes=1)
+    resolved = ResolvedCommand(command="sleep 0.2", cwd=None, env={}, timeout_secs=None, vars={})
+    first = RunResult(command_name="first")
+    second = RunResult(command_name="second")
+    third = RunResult(command_name="third")
+
+    for result in (first, second, third):
+        await executor.start_run(result, resolved)
+    await asyncio.sleep(0.1)
+
+    assert first.state == RunState.RUNNING
+    assert second.state == RunState.PENDING
+
+    # Cancelling a queued run must not leak or consume a slot
+    await executor.cancel_run(second)
+    assert second.state == RunState.CANCELLED
+
+    await asyncio.sleep(0.6)
+    assert first.state == RunState.SUCCESS
+    assert third.state == RunState.SUCCESS
+    await executor.cleanup()
+
+
+def test_local_executor_rejects_invalid_max_processes():
+    with pytest.raises(ValueError, match="max_processes"):
+        LocalSubprocessExecutor(max_processes=0)
+
+
 @pytest.mark.asyncio
 async def test_local_executor_cleanup(local_executor):
     """Test LocalSubprocessExecutor cleanup cancels active runs."""
@@ -370,6 +401,47 @@ async def test_local_executor_cleanup(local_executor):
     assert len(local_executor._tasks) == 0
 
 
+@pytest.mark.parametrize(
+    "command, expected",
+    [
+        ("echo 'Hello World'", ["echo", "Hello World"]),
+        ('pytest -x --maxfail=1 "tests dir"', ["pytest", "-x", "--maxfail=1", "tests dir"]),
+        ("echo a; echo b", None),
+        ("ls | wc -l", None),
+        ("echo $HOME", None),
+        ("ls *.py", None),
+        ("FOO=bar env", None),
+        ("echo 'unbalanced", None),
+        ("   ", None),
+    ],
+)
+def test_shell_free_argv(command, expected):
+    """Only commands without shell syntax are split for direct exec."""
+    if sys.platform == "win32":
+        expected = None
+    assert _shell_free_argv(command) == expected
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX shell semantics")
+async def test_local_executor_missing_binary_falls_back_to_shell(local_executor):
+    """A simple command whose executable is missing reports the shell's exit code."""
+    result = RunResult(command_name="missing_binary")
+    resolved = ResolvedCommand(
+        command="cmdorc-no-such-binary --version",
+        cwd=None,
+        env={},
+        timeout_secs=None,
+        vars={},
+    )
+
+    await local_executor.start_run(result, resolved)
+    await asyncio.sleep(0.5)
+
+    assert result.state == RunState.FAILED
+    assert "exited with code 127" in str(result.error)
+
+
 @pytest.mark.asyncio
 async def test_local_executor_supports_features(local_executor):
     """Test LocalSubprocessExecutor feature support."""
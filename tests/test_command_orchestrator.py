@@ -17,6 +17,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import sys
 from datetime import datetime, timedelta
 
 import pytest
@@ -387,6 +388,57 @@ class TestAutoTriggers:
 
         assert "command_started" in triggered_events
 
+    async def test_command_started_dispatched_after_run_command_returns(self, orchestrator):
+        """By default command_started callbacks run after run_command() returns."""
+        triggered_events = []
+
+        def callback(handle, context):
+            triggered_events.append("command_started")
+
+        orchestrator.on_event("command_started:Test", callback)
+
+        await orchestrator.run_command("Test")
+        assert triggered_events == []
+
+        await orchestrator.wait_until_idle(timeout=1.0)
+        assert triggered_events == ["command_started"]
+
+    @pytest.mark.skipif(sys.version_info < (3, 12), reason="eager tasks need Python 3.12+")
+    async def test_command_started_dispatched_eagerly(self, sample_command):
+        """With eager_tasks=True, command_started callbacks run before run_command() returns."""
+        config = RunnerConfig(commands=[sample_command], vars={})
+        orchestrator = CommandOrchestrator(config, MockExecutor(delay=0.01), eager_tasks=True)
+        triggered_events = []
+
+        def callback(handle, context):
+            triggered_events.append("command_started")
+
+        orchestrator.on_event("command_started:Test", callback)
+
+        await orchestrator.run_command("Test")
+
+        assert triggered_events == ["command_started"]
+        await orchestrator.shutdown()
+
+    async def test_command_started_dispatched_before_completion_events(self, orchestrator):
+        """command_started callbacks finish before the run's completion event is emitted."""
+        triggered_events = []
+
+        async def on_started(handle, context):
+            await asyncio.sleep(0.05)  # Outlasts the 10ms mock run
+            triggered_events.append("command_started")
+
+        def on_success(handle, context):
+            triggered_events.append("command_success")
+
+        orchestrator.on_event("command_started:Test", on_started)
+        orchestrator.on_event("command_success:Test", on_success)
+
+        await orchestrator.run_command("Test")
+        await orchestrator.wait_until_idle(timeout=1.0)
+
+        assert triggered_events == ["command_started", "command_success"]
+
     async def test_command_success_trigger_emitted(self, orchestrator):
         """command_success:name auto-trigger is emitted."""
         triggered_events = []
@@ -561,6 +613,30 @@ class TestHandleManagement:
         # Handle should be unregistered
         assert handle.run_id not in orchestrator._handles
 
+    async def test_wait_until_idle_returns_immediately_when_idle(self, orchestrator):
+        """wait_until_idle() returns at once when nothing has been started."""
+        await orchestrator.wait_until_idle(timeout=0.1)
+
+    async def test_wait_until_idle_waits_for_trigger_chain(self, multi_command_orchestrator):
+        """wait_until_idle() covers runs started by lifecycle triggers (Lint -> Build)."""
+        await multi_command_orchestrator.trigger("changes_applied")
+
+        await multi_command_orchestrator.wait_until_idle(timeout=1.0)
+
+        assert not multi_command_orchestrator._handles
+        assert len(multi_command_orchestrator.get_history("Lint")) == 1
+        assert len(multi_command_orchestrator.get_history("Build")) == 1
+
+    async def test_wait_until_idle_timeout(self, orchestrator):
+        """wait_until_idle() raises TimeoutError while a run is still in flight."""
+        orchestrator._executor.delay = 1.0
+        await orchestrator.run_command("Test")
+
+        with pytest.raises(asyncio.TimeoutError):
+            await orchestrator.wait_until_idle(timeout=0.05)
+
+        await orchestrator.shutdown(timeout=0.1)
+
 
 # ========================================================================
 # Cancellation Tests
@@ -840,6 +916,19 @@ class TestQueries:
         status = orchestrator.get_status("Test")
         assert status.state == "success"
 
+    async def test_get_all_statuses(self, orchestrator):
+        """get_all_statuses() returns a CommandStatus for every command."""
+        orchestrator.add_command(CommandConfig(name="Other", command="echo", triggers=[]))
+
+        handle = await orchestrator.run_command("Test")
+        await handle.wait(timeout=1.0)
+        await orchestrator.wait_until_idle(timeout=1.0)
+
+        statuses = orchestrator.get_all_statuses()
+        assert list(statuses) == orchestrator.list_commands()
+        assert statuses["Test"].state == "success"
+        assert statuses["Other"].state == "never_run"
+
     async def test_get_history(self, orchestrator):
         """get_history() returns past runs in order."""
         # Run command multiple times
@@ -1045,6 +1134,50 @@ class TestCallbacks:
 
         assert len(called) == 0
 
+    async def test_typed_command_hooks(self, multi_command_orchestrator):
+        """on_command_*() hooks fire for every command's matching lifecycle event."""
+        orchestrator = multi_command_orchestrator
+        events = []
+
+        def recorder(event_type):
+            def record(handle, context):
+                events.append(event_type)
+
+            return record
+
+        orchestrator.on_command_started(recorder("command_started"))
+        orchestrator.on_command_success(recorder("command_success"))
+        orchestrator.on_command_failed(recorder("command_failed"))
+        orchestrator.on_command_cancelled(recorder("command_cancelled"))
+
+        await orchestrator.run_command("Lint")
+        await orchestrator.wait_until_idle(timeout=1.0)
+
+        # Lint and Build each start and succeed once. Build starts from Lint's success
+        # event, so the relative order of their callbacks is not asserted here.
+        assert sorted(events) == [
+            "command_started",
+            "command_started",
+            "command_success",
+            "command_success",
+        ]
+
+    async def test_typed_command_hook_removed_with_off_event(self, orchestrator):
+        """Typed hooks are removed through the equivalent wildcard pattern."""
+        called = []
+
+        def callback(handle, context):
+            called.append(True)
+
+        orchestrator.on_command_success(callback)
+        assert orchestrator.off_event("command_success:*", callback) is True
+
+        handle = await orchestrator.run_command("Test")
+        await handle.wait(timeout=1.0)
+        await orchestrator.wait_until_idle(timeout=1.0)
+
+        assert called == []
+
     async def test_set_lifecycle_callback(self, orchestrator):
         """set_lifecycle_callback() registers callbacks for run states."""
         config = CommandConfig(
@@ -1146,6 +1279,23 @@ class TestShutdown:
 
         assert result["timeout_expired"] is True
 
+    async def test_shutdown_joins_background_tasks(self, orchestrator):
+        """shutdown() returns only after run monitors have dispatched lifecycle callbacks."""
+        completed = []
+
+        async def on_success(handle, context):
+            await asyncio.sleep(0.05)  # Still running when the handle resolves
+            completed.append(handle.command_name)
+
+        orchestrator.set_lifecycle_callback("Test", on_success=on_success)
+
+        await orchestrator.run_command("Test")
+        result = await orchestrator.shutdown(timeout=1.0, cancel_running=False)
+
+        assert completed == ["Test"]
+        assert not orchestrator._tasks
+        assert result["timeout_expired"] is False
+
     async def test_cleanup_immediate(self, orchestrator):
         """cleanup() does immediate cleanup without waiting."""
         await orchestrator.run_command("Test")
@@ -1446,6 +1596,16 @@ class TestErrorHandlingAndEdgeCases:
 
         # Should not raise or cause infinite loop
 
+    async def test_emit_auto_trigger_logs_cycle_without_subscribers(self, orchestrator, caplog):
+        """A repeated auto-trigger nobody subscribes to still logs the cycle."""
+        context = TriggerContext(seen={"command_success:Test"}, history=["command_success:Test"])
+
+        with caplog.at_level(logging.WARNING, logger="cmdorc"):
+            await orchestrator._emit_auto_trigger("command_success:Test", None, context)
+
+        assert "Trigger cycle detected: command_success:Test" in caplog.text
+        assert context.history == ["command_success:Test"]
+
     async def test_dispatch_callbacks_with_sync_callback(self, orchestrator):
         """_dispatch_callbacks handles synchronous callbacks."""
         sync_called = []
@@ -1460,6 +1620,34 @@ class TestErrorHandlingAndEdgeCases:
 
         assert True in sync_called
 
+    async def test_dispatch_callbacks_awaits_async_callable_object(self, orchestrator):
+        """_dispatch_callbacks awaits callables whose __call__ is a coroutine."""
+        calls = []
+
+        class Handler:
+            async def __call__(self, handle, context):
+                calls.append(context)
+
+        def returns_value(handle, context):
+            return "not awaitable"
+
+        orchestrator.on_event("obj_event", Handler())
+        orchestrator.on_event("obj_event", returns_value)
+
+        await orchestrator.trigger("obj_event")
+
+        assert len(calls) == 1
+
+    async def test_dispatch_callbacks_does_not_await_returned_future(self, orchestrator):
+        """Only coroutines are awaited; a Future returned by a sync callback is left alone."""
+        future = asyncio.get_running_loop().create_future()
+        orchestrator.on_event("future_event", lambda handle, context: future)
+
+        await asyncio.wait_for(orchestrator.trigger("future_event"), timeout=1.0)
+
+        assert not future.done()
+        future.cancel()
+
     async def test_dispatch_callbacks_exception_in_callback(self, orchestrator):
         """_dispatch_callbacks propagates exceptions from manual triggers."""
 
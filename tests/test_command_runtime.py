@@ -211,6 +211,20 @@ def test_get_active_runs_nonexistent_command(runtime):
         runtime.get_active_runs("nonexistent")
 
 
+def test_find_active_run(runtime, simple_config):
+    """Test finding an active run by run_id until it completes."""
+    runtime.register_command(simple_config)
+    run = RunResult(command_name=simple_config.name, run_id="run-1")
+    runtime.add_live_run(run)
+
+    assert runtime.find_active_run("run-1") is run
+    assert runtime.find_active_run("missing") is None
+
+    run.mark_success()
+    runtime.mark_run_complete(run)
+    assert runtime.find_active_run("run-1") is None
+
+
 # ================================================================
 # Run Completion Tests
 # ================================================================
@@ -477,6 +491,22 @@ def test_get_status_running_with_history(runtime, simple_config):
     assert status.last_run is run1
 
 
+def test_get_all_statuses(runtime, simple_config):
+    """Test that get_all_statuses() returns every command's status in registration order."""
+    other = CommandConfig(name="Other", command="echo other", triggers=[])
+    runtime.register_command(simple_config)
+    runtime.register_command(other)
+
+    run = RunResult(command_name=other.name, run_id="run-1")
+    runtime.add_live_run(run)
+
+    statuses = runtime.get_all_statuses()
+    assert list(statuses) == [simple_config.name, "Other"]
+    assert statuses[simple_config.name].state == "never_run"
+    assert statuses["Other"].state == "running"
+    assert statuses["Other"].active_count == 1
+
+
 def test_get_status_nonexistent_raises(runtime):
     """Test that getting status for non-existent command raises KeyError."""
     with pytest.raises(CommandNotFoundError, match="not registered"):
@@ -203,7 +203,7 @@ class TestEdgeCases:
         )
 
         # Manually break it for testing
-        config.__dict__["on_retrigger"] = "invalid_value"
+        object.__setattr__(config, "on_retrigger", "invalid_value")
 
         active_run = RunResult(command_name="test")
 
@@ -6,7 +6,8 @@ from pathlib import Path
 
 import pytest
 
-from cmdorc import ConfigValidationError, load_config
+from cmdorc import CommandConfig, ConfigValidationError, load_config
+from cmdorc.command_config import validate_trigger
 
 logging.getLogger("cmdorc").setLevel(logging.DEBUG)
 
@@ -32,6 +33,21 @@ def test_load_minimal_config(minimal_toml):
     assert cmd.triggers == ["start"]
 
 
+def test_load_config_from_text_stream():
+    """Text-mode streams are accepted as well as binary ones."""
+    config = load_config(
+        io.StringIO(
+            """
+[[command]]
+name = "Hello"
+command = "echo hello"
+triggers = ["start"]
+"""
+        )
+    )
+    assert [cmd.name for cmd in config.commands] == ["Hello"]
+
+
 def test_variables_stored_as_templates():
     """Variables in config are stored as templates, not pre-resolved."""
     toml = io.BytesIO(
@@ -112,6 +128,30 @@ cancel_on_triggers = ["stop", "invalid*"]
         load_config(toml)
 
 
+def test_unicode_word_triggers_allowed():
+    toml = io.BytesIO(
+        """
+[[command]]
+name = "Unicode"
+command = "echo ok"
+triggers = ["café_saved", "command_success:Größe", "ステップ-1"]
+""".encode()
+    )
+    config = load_config(toml)
+    assert config.commands[0].triggers == ["café_saved", "command_success:Größe", "ステップ-1"]
+
+
+def test_validated_trigger_cache_respects_wildcard_mode():
+    # A name accepted with wildcards must still be rejected without them
+    assert validate_trigger("build:*", allow_wildcards=True) == "build:*"
+    with pytest.raises(ConfigValidationError, match="Invalid trigger name"):
+        CommandConfig(name="A", command="echo", triggers=["build:*"])
+
+    # Shared trigger names validate once and keep working across commands
+    for name in ("A", "B"):
+        assert CommandConfig(name=name, command="echo", triggers=["shared"]).triggers == ["shared"]
+
+
 def test_empty_command_list():
     with pytest.raises(ConfigValidationError, match="At least one.*required"):
         load_config(io.BytesIO(b""))
@@ -116,6 +116,16 @@ class TestOutputStorageConfig:
         with pytest.raises(ConfigValidationError, match="cannot contain path separators"):
             OutputStorageConfig(output_extension=".txt\\bad")
 
+    def test_runner_configs_share_default_instance(self):
+        """RunnerConfigs without output_storage share one frozen default."""
+        commands = [CommandConfig(name="Test", command="echo", triggers=[])]
+        first = RunnerConfig(commands=commands)
+        second = RunnerConfig(commands=commands)
+
+        assert first.output_storage is second.output_storage
+        assert first.output_storage == OutputStorageConfig()
+        assert not first.output_storage.is_enabled
+
 
 # =====================================================================
 # TOML Serialization Tests
@@ -56,6 +56,11 @@ class TestPropertyDelegation:
         """RunHandle.run_id should return result's run_id."""
         assert sample_handle.run_id == "run-1"
 
+    def test_short_id_property(self):
+        """RunHandle.short_id should return the first 8 characters of run_id."""
+        handle = RunHandle(RunResult(command_name="test", run_id="0123456789abcdef"))
+        assert handle.short_id == "01234567"
+
     def test_state_property(self, sample_handle: RunHandle):
         """RunHandle.state should return result's state."""
         assert sample_handle.state == RunState.PENDING
@@ -2,6 +2,7 @@
 
 import datetime
 import time
+import uuid
 
 from cmdorc import ResolvedCommand, RunResult, RunState
 
@@ -18,6 +19,13 @@ def test_initial_state():
     assert r.resolved_command is None
 
 
+def test_run_id_is_hex_uuid():
+    r = RunResult(command_name="build")
+    assert len(r.run_id) == 32
+    assert uuid.UUID(r.run_id).hex == r.run_id
+    assert RunResult(command_name="build").run_id != r.run_id
+
+
 def test_mark_running_sets_start_time_and_state():
     r = RunResult(command_name="test")
     r.mark_running()
@@ -166,6 +174,35 @@ def test_duration_without_start_time():
     assert r.duration == datetime.timedelta(0)
 
 
+def test_duration_uses_monotonic_clock(monkeypatch):
+    r = RunResult(command_name="clock_jump")
+    r.mark_running()
+
+    # Wall clock jumps forward an hour mid-run (e.g. NTP correction)
+    real_now = datetime.datetime.now()
+
+    class JumpedDatetime(datetime.datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return real_now + datetime.timedelta(hours=1)
+
+    monkeypatch.setattr(datetime, "datetime", JumpedDatetime)
+    r.mark_success()
+
+    assert r.duration_secs is not None
+    assert r.duration_secs < 60
+
+
+def test_duration_is_exact_monotonic_ns_delta(monkeypatch):
+    r = RunResult(command_name="ns")
+    monkeypatch.setattr(time, "monotonic_ns", lambda: 1_000_000_000)
+    r.mark_running()
+    monkeypatch.setattr(time, "monotonic_ns", lambda: 3_500_250_999)
+    r.mark_success()
+
+    assert r.duration == datetime.timedelta(seconds=2, microseconds=500_250)
+
+
 def test_duration_str_formatting():
     r = RunResult(command_name="format_test")
     r.start_time = datetime.datetime.now() - datetime.timedelta(seconds=1.5)
@@ -178,6 +178,25 @@ def test_resolve_runtime_vars_custom_max_depth():
     assert result == "value"
 
 
+def test_resolve_runtime_vars_reuse_tracks_nested_values():
+    """Repeated resolution reflects changes to any variable it depends on, even nested ones."""
+    template = "run {{ target }} --flag"
+    vars_dict = {"target": "{{ base }}/app", "base": "/srv", "unrelated": "x"}
+
+    assert resolve_runtime_vars(template, vars_dict) == "run /srv/app --flag"
+    assert resolve_runtime_vars(template, {**vars_dict, "unrelated": "y"}) == "run /srv/app --flag"
+    assert resolve_runtime_vars(template, {**vars_dict, "base": "/opt"}) == "run /opt/app --flag"
+    assert resolve_runtime_vars(template, {**vars_dict, "target": "here"}) == "run here --flag"
+
+
+def test_resolve_runtime_vars_reuse_still_reports_missing():
+    """A previously resolved template still fails once a variable it needs disappears."""
+    resolve_runtime_vars("echo {{ gone }}", {"gone": "here"})
+
+    with pytest.raises(VariableResolutionError, match="Missing variable: 'gone'"):
+        resolve_runtime_vars("echo {{ gone }}", {})
+
+
 # =====================================================================
 #   Test prepare_resolved_command
 # =====================================================================
@@ -406,3 +425,19 @@ def test_prepare_resolved_command_complex_scenario(monkeypatch):
     assert resolved.vars["target"] == "eu-west"
     assert resolved.vars["debug"] == "true"
     assert resolved.vars["log_level"] == "info"
+
+
+def test_prepare_resolved_command_env_snapshot_not_shared(monkeypatch):
+    """Each call takes a fresh os.environ snapshot; results don't alias each other."""
+    monkeypatch.setenv("CMDORC_SNAPSHOT", "one")
+    config = CommandConfig(name="Test", command="echo $CMDORC_SNAPSHOT", triggers=[])
+
+    first = prepare_resolved_command(config, {})
+    monkeypatch.setenv("CMDORC_SNAPSHOT", "two")
+    second = prepare_resolved_command(config, {})
+
+    assert first.command == "echo one"
+    assert second.command == "echo two"
+    assert first.env["CMDORC_SNAPSHOT"] == "one"
+    assert second.env["CMDORC_SNAPSHOT"] == "two"
+    assert first.env is not second.env
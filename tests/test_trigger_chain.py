@@ -163,6 +163,51 @@ class TestCycleDetectionWithChains:
         # Cancel to stop
         await orchestrator.cancel_command("Infinite")
 
+    async def test_sibling_runs_have_independent_chains(self):
+        """Runs started by the same event don't share cycle state (diamond is not a cycle)."""
+        commands = [
+            CommandConfig(name="A", command="echo a", triggers=["go"]),
+            CommandConfig(name="B", command="echo b", triggers=["go"]),
+            CommandConfig(
+                name="Join",
+                command="echo join",
+                triggers=["command_success:A", "command_success:B"],
+                max_concurrent=0,
+            ),
+            CommandConfig(
+                name="After",
+                command="echo after",
+                triggers=["command_success:Join"],
+                max_concurrent=0,
+            ),
+        ]
+        orchestrator = CommandOrchestrator(
+            RunnerConfig(commands=commands), executor=MockExecutor(delay=0.01)
+        )
+
+        await orchestrator.trigger("go")
+        await orchestrator.wait_until_idle(timeout=2.0)
+
+        # Both branches reach Join and continue past it
+        assert len(orchestrator.get_history("Join")) == 2
+        after_chains = sorted(r.trigger_chain for r in orchestrator.get_history("After"))
+        assert after_chains == [
+            [
+                "go",
+                "command_started:A",
+                "command_success:A",
+                "command_started:Join",
+                "command_success:Join",
+            ],
+            [
+                "go",
+                "command_started:B",
+                "command_success:B",
+                "command_started:Join",
+                "command_success:Join",
+            ],
+        ]
+
 
 class TestTriggerChainMutationPrevention:
     """Test that returned chains are copies."""
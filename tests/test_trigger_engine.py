@@ -174,6 +174,47 @@ class TestCommandMatching:
         assert len(matches) == 1
         assert matches[0].name == "Lint"
 
+    def test_index_tracks_config_changes(self, engine: TriggerEngine, runtime: CommandRuntime):
+        """Matches should reflect commands registered, updated, or removed after a lookup."""
+        runtime.register_command(CommandConfig(name="First", command="echo 1", triggers=["go"]))
+        assert [c.name for c in engine.get_matching_commands("go", "triggers")] == ["First"]
+
+        runtime.register_command(CommandConfig(name="Second", command="echo 2", triggers=["go"]))
+        assert [c.name for c in engine.get_matching_commands("go", "triggers")] == [
+            "First",
+            "Second",
+        ]
+
+        runtime.update_command(CommandConfig(name="First", command="echo 1", triggers=["stop"]))
+        assert [c.name for c in engine.get_matching_commands("go", "triggers")] == ["Second"]
+        assert [c.name for c in engine.get_matching_commands("stop", "triggers")] == ["First"]
+
+        runtime.remove_command("Second")
+        assert engine.get_matching_commands("go", "triggers") == ()
+
+    def test_get_trigger_map(self, engine: TriggerEngine, runtime: CommandRuntime):
+        """get_trigger_map() should map each trigger to command names per trigger type."""
+        runtime.register_command(
+            CommandConfig(
+                name="Build",
+                command="echo b",
+                triggers=["save", "build"],
+                cancel_on_triggers=["stop"],
+            )
+        )
+        runtime.register_command(CommandConfig(name="Test", command="echo t", triggers=["save"]))
+
+        assert engine.get_trigger_map() == {"save": ["Build", "Test"], "build": ["Build"]}
+        assert engine.get_trigger_map("cancel_on_triggers") == {"stop": ["Build"]}
+
+    def test_duplicate_trigger_matches_once(self, engine: TriggerEngine, runtime: CommandRuntime):
+        """A trigger listed twice on one command should match that command once."""
+        runtime.register_command(
+            CommandConfig(name="Twice", command="echo 2", triggers=["go", "go"])
+        )
+        matches = engine.get_matching_commands("go", "triggers")
+        assert [c.name for c in matches] == ["Twice"]
+
 
 # ========================================================================
 # Callback Registration Tests
@@ -251,6 +292,21 @@ class TestCallbackRegistration:
         callbacks = engine.get_matching_callbacks("command_success")
         assert len(callbacks) == 0
 
+    def test_unregister_event_type_wildcard_callback(self, engine: TriggerEngine):
+        """Lifecycle "type:*" callbacks should be unregisterable, leaving others in place."""
+
+        def callback():
+            pass
+
+        def other_callback():
+            pass
+
+        engine.register_callback("command_success:*", callback)
+        engine.register_callback("command_success:*", other_callback)
+        assert engine.unregister_callback("command_success:*", callback) is True
+        callbacks = engine.get_matching_callbacks("command_success:Tests")
+        assert callbacks == [(other_callback, True)]
+
     def test_unregister_nonexistent_wildcard_callback(self, engine: TriggerEngine):
         """Unregistering non-existent wildcard callback should return False."""
 
@@ -317,6 +373,61 @@ class TestCallbackRegistration:
             engine.register_callback("event", None)  # type: ignore
 
 
+# ========================================================================
+# Subscriber Check Tests
+# ========================================================================
+
+
+class TestHasSubscribers:
+    """Tests for has_subscribers()."""
+
+    def test_no_subscribers(self, engine: TriggerEngine, runtime, sample_configs):
+        """Events without matching triggers or callbacks have no subscribers."""
+        for config in sample_configs:
+            runtime.register_command(config)
+
+        assert engine.has_subscribers("unknown_event") is False
+        assert engine.has_subscribers("command_success:Build") is False
+
+    def test_command_triggers(self, engine: TriggerEngine, runtime, sample_configs):
+        """Exact triggers and cancel_on_triggers count as subscribers."""
+        for config in sample_configs:
+            runtime.register_command(config)
+
+        assert engine.has_subscribers("changes_applied") is True
+        assert engine.has_subscribers("command_success:Tests") is True
+        assert engine.has_subscribers("urgent_stop") is True
+
+    def test_callbacks(self, engine: TriggerEngine):
+        """Exact and wildcard callbacks count as subscribers until unregistered."""
+
+        def callback(handle, context):
+            pass
+
+        engine.register_callback("saved", callback)
+        engine.register_callback("command_failed:*", callback)
+
+        assert engine.has_subscribers("saved") is True
+        assert engine.has_subscribers("command_failed:Build") is True
+        assert engine.has_subscribers("command_success:Build") is False
+
+        engine.unregister_callback("saved", callback)
+        engine.unregister_callback("command_failed:*", callback)
+
+        assert engine.has_subscribers("saved") is False
+        assert engine.has_subscribers("command_failed:Build") is False
+
+    def test_other_wildcard_patterns_are_conservative(self, engine: TriggerEngine):
+        """Non "type:*" wildcard patterns make every event a possible match."""
+
+        def callback(handle, context):
+            pass
+
+        engine.register_callback("build_*", callback)
+
+        assert engine.has_subscribers("anything") is True
+
+
 # ========================================================================
 # Callback Dispatch Order Tests
 # ========================================================================
@@ -385,6 +496,49 @@ class TestDispatchOrder:
         assert callbacks[0][0] == wildcard1
         assert callbacks[1][0] == wildcard2
 
+    def test_event_type_and_general_wildcards_keep_registration_order(self, engine: TriggerEngine):
+        """Indexed "type:*" and scanned wildcards should interleave by registration."""
+
+        def general1():
+            pass
+
+        def typed():
+            pass
+
+        def general2():
+            pass
+
+        engine.register_callback("command_*", general1)
+        engine.register_callback("command_success:*", typed)
+        engine.register_callback("*:Tests", general2)
+
+        callbacks = engine.get_matching_callbacks("command_success:Tests")
+        assert [cb for cb, _ in callbacks] == [general1, typed, general2]
+        assert all(is_wildcard for _, is_wildcard in callbacks)
+
+    def test_event_type_wildcard_requires_separator(self, engine: TriggerEngine):
+        """A "type:*" pattern should not match the bare event type."""
+
+        def callback():
+            pass
+
+        engine.register_callback("command_success:*", callback)
+
+        assert engine.get_matching_callbacks("command_success") == []
+        assert engine.get_matching_callbacks("command_success:") == [(callback, True)]
+        assert engine.get_matching_callbacks("command_failed:Tests") == []
+
+    def test_multi_colon_wildcard(self, engine: TriggerEngine):
+        """Patterns with several colons should still match by full pattern."""
+
+        def callback():
+            pass
+
+        engine.register_callback("a:b:*", callback)
+
+        assert engine.get_matching_callbacks("a:b:c") == [(callback, True)]
+        assert engine.get_matching_callbacks("a:c") == []
+
 
 # ========================================================================
 # Cycle Detection Tests
@@ -1,6 +1,11 @@
 # tests/test_utils.py
 
-from cmdorc import format_duration
+import asyncio
+import sys
+
+import pytest
+
+from cmdorc import format_duration, run_with_uvloop
 
 
 def test_format_duration_milliseconds():
@@ -38,3 +43,19 @@ def test_format_duration_weeks():
     assert format_duration(86400 * 10) == "1w 3d"
     assert format_duration(86400 * 14) == "2w"
     assert format_duration(86400 * 21 + 86400 * 2) == "3w 2d"
+
+
+async def _running_loop_type():
+    return type(asyncio.get_running_loop())
+
+
+def test_run_with_uvloop_without_uvloop(monkeypatch):
+    monkeypatch.setitem(sys.modules, "uvloop", None)  # Makes "import uvloop" raise ImportError
+    assert issubclass(run_with_uvloop(_running_loop_type()), asyncio.BaseEventLoop)
+
+
+def test_run_with_uvloop_runs_on_uvloop():
+    uvloop = pytest.importorskip("uvloop")
+    default_policy = asyncio.get_event_loop_policy()
+    assert run_with_uvloop(_running_loop_type()) is uvloop.Loop
+    assert asyncio.get_event_loop_policy() is default_policy